@@ -89,7 +89,7 @@ class FireworksASR:
     def transcribe_audio(self, audio_file_path: str, model_id: str, language_code: str = 'en') -> Dict:
         try:
             # Phase 1: Request preparation
-            prep_start = time.time()
+            prep_start = time.perf_counter()
             
             url = f"{self.base_url}/audio/transcriptions"
             
@@ -121,17 +121,17 @@ class FireworksASR:
                     # Remove Content-Type header to let requests set it automatically for multipart
                 }
                 
-                prep_time = time.time() - prep_start
+                prep_time = time.perf_counter() - prep_start
                 
                 # Phase 2: Network request
-                network_start = time.time()
+                network_start = time.perf_counter()
                 response = requests.post(url, headers=headers, files=files, data=data)
-                network_time = time.time() - network_start
+                network_time = time.perf_counter() - network_start
                 
                 # Phase 3: Response processing
-                response_start = time.time()
+                response_start = time.perf_counter()
                 processing_time = network_time  # Total processing time for backward compatibility
-                response_time = time.time() - response_start
+                response_time = time.perf_counter() - response_start
             
             if response.status_code == 200:
                 result = response.json()
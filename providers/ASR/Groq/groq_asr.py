@@ -58,7 +58,7 @@ class GroqASR:
         
         try:
             # Phase 1: Request preparation
-            prep_start = time.time()
+            prep_start = time.perf_counter()
             
             # Prepare the request headers
             headers = {
@@ -83,10 +83,10 @@ class GroqASR:
                 'response_format': 'json'
             }
             
-            prep_time = time.time() - prep_start
+            prep_time = time.perf_counter() - prep_start
             
             # Phase 2: Network request
-            network_start = time.time()
+            network_start = time.perf_counter()
             
             # Make request to Groq API
             response = requests.post(
@@ -97,17 +97,17 @@ class GroqASR:
                 timeout=60
             )
             
-            network_time = time.time() - network_start
+            network_time = time.perf_counter() - network_start
             
             # Phase 3: Response processing
-            response_start = time.time()
+            response_start = time.perf_counter()
             
             # Make sure to close the file
             files['file'].close()
             
             # Total processing time (network only for backward compatibility)
             processing_time = network_time
-            response_time = time.time() - response_start
+            response_time = time.perf_counter() - response_start
             
             if response.status_code == 200:
                 result = response.json()
@@ -179,9 +179,9 @@ class GroqASR:
         Returns:
             Dictionary with detailed timing information
         """
-        total_start_time = time.time()
+        total_start_time = time.perf_counter()
         result = self.transcribe_audio(audio_file_path, model_id, language_code)
-        total_end_time = time.time()
+        total_end_time = time.perf_counter()
         
         total_processing_time = total_end_time - total_start_time
         api_processing_time = result.get('processing_time', 0.0)  # API call time from transcribe_audio
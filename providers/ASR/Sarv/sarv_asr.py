@@ -1,10 +1,28 @@
 import requests
-import json
+import mmap
+import asyncio
+import time
 from typing import List, Dict, Optional
-import sys
 import os
-# Add providers/core to path for base provider import
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'core'))
+
+from providers.core.http_session_pool import get_shared_session
+from providers.core.json_codec import json_loads
+from providers.core.results import TranscriptionResult
+
+try:
+    import aiohttp
+except ImportError:
+    # Async API is optional; the sync API only needs requests
+    aiohttp = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    # Without requests_toolbelt uploads fall back to requests' in-memory multipart body
+    MultipartEncoder = None
+
+# Seconds a service-status probe result is reused before probing again
+STATUS_CACHE_TTL = 5.0
 
 class SarvASR:
     """Sarv ASR provider for Indian languages"""
@@ -14,6 +32,8 @@ class SarvASR:
         self.api_key = api_key or "http://103.255.103.118:5001"
         self.provider_name = config['provider']['name']
         self.base_url = self.api_key.rstrip('/')
+        self._url_upload = self.base_url + '/upload'
+        self._url_status = self.base_url + '/status'
         self.supported_languages = {
             'assamese': 'as',
             'bengali': 'bn',
@@ -38,6 +58,19 @@ class SarvASR:
             'telugu': 'te',
             'urdu': 'ur'
         }
+        
+        # Lookup table from accepted language codes (short or full, e.g. hi-IN) to Sarv codes
+        self._lang_map = {code: code for code in self.supported_languages.values()}
+        for code in config.get('supported_languages', []):
+            self._lang_map[code] = code.partition('-')[0]
+        
+        # Keep-alive session shared by every instance pointing at the same server;
+        # it is closed by close_shared_sessions(), not per instance
+        self.session = get_shared_session(self.base_url)
+        
+        self._status_cache = None
+        self._status_ts = 0.0
+        self._aio_session = None
     
     def get_available_models(self) -> List[Dict]:
         models = []
@@ -93,124 +126,173 @@ class SarvASR:
     
     def _map_language_code(self, language_code: str) -> str:
         """Map language codes from full format (e.g., hi-IN) to Sarv format (e.g., hi)"""
-        # If it's already in the short format, return as is
-        if language_code in self.supported_languages.values():
-            return language_code
-        
-        # Map common full codes to short codes
-        code_mapping = {
-            'hi-IN': 'hi',
-            'as-IN': 'as',
-            'bn-IN': 'bn',
-            'brx-IN': 'brx',
-            'doi-IN': 'doi',
-            'gu-IN': 'gu',
-            'kn-IN': 'kn',
-            'kok-IN': 'kok',
-            'ks-IN': 'ks',
-            'mai-IN': 'mai',
-            'ml-IN': 'ml',
-            'mni-IN': 'mni',
-            'mr-IN': 'mr',
-            'ne-IN': 'ne',
-            'or-IN': 'or',
-            'pa-IN': 'pa',
-            'sa-IN': 'sa',
-            'sat-IN': 'sat',
-            'sd-IN': 'sd',
-            'ta-IN': 'ta',
-            'te-IN': 'te',
-            'ur-IN': 'ur'
-        }
-        
-        return code_mapping.get(language_code, language_code.split('-')[0])
+        return self._lang_map.get(language_code) or language_code.partition('-')[0]
 
     def transcribe_audio(self, audio_file_path: str, model_id: str, language_code: str = 'hi') -> Dict:
+        """Transcribe an audio file and return the standard response dict"""
+        return self.transcribe(audio_file_path, model_id, language_code).to_dict()
+    
+    def transcribe(self, audio_file_path: str, model_id: str, language_code: str = 'hi') -> TranscriptionResult:
+        """Transcribe an audio file with the Sarv /upload endpoint"""
         try:
-            url = f"{self.base_url}/upload"
-            
-            # Parse model preferences from model_id
-            model_preference = None
-            decoding_strategy = 'ctc'
-            
-            if 'hindi-specific' in model_id:
-                model_preference = 'hindi-specific'
-            elif 'hindi-multilingual' in model_id:
-                model_preference = 'hindi-multilingual'
-            
-            if 'rnnt' in model_id:
-                decoding_strategy = 'rnnt'
-            
-            # Map language code to Sarv format
-            sarv_language_code = self._map_language_code(language_code)
+            url = self._url_upload
+            data = self._build_form_data(model_id, language_code)
             
-            # Prepare the request
+            # Upload from a read-only memory map so the body is served from the page cache
             with open(audio_file_path, 'rb') as audio_file:
-                files = {'audio': audio_file}
-                data = {
-                    'language': sarv_language_code,
-                    'decoding_strategy': decoding_strategy,
-                    'debug': 'true'  # Enable debug mode for detailed timing
-                }
-                
-                if model_preference:
-                    data['model_preference'] = model_preference
-                
-                response = requests.post(url, files=files, data=data)
+                with mmap.mmap(audio_file.fileno(), 0, access=mmap.ACCESS_READ) as audio_map:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        audio_map.madvise(mmap.MADV_SEQUENTIAL)
+                    audio_field = (os.path.basename(audio_file_path), audio_map, 'application/octet-stream')
+                    if MultipartEncoder is not None:
+                        # Stream the multipart body instead of assembling it in memory
+                        encoder = MultipartEncoder(fields={**data, 'audio': audio_field})
+                        response = self.session.post(url, data=encoder,
+                                                     headers={'Content-Type': encoder.content_type})
+                    else:
+                        response = self.session.post(url, files={'audio': audio_field}, data=data)
             
             if response.status_code == 200:
-                result = response.json()
-                
-                if result.get('success', False):
-                    return {
-                        'success': True,
-                        'transcription': result.get('transcription', ''),
-                        'confidence': 1.0,  # Sarv doesn't provide confidence scores
-                        'processing_time': result.get('processing_time', 0.0),
-                        'audio_duration': result.get('audio_duration', 0.0),
-                        'model_used': result.get('model_used', 'Unknown'),
-                        'real_time_factor': result.get('real_time_factor', 0.0),
-                        'end_to_end_time': result.get('end_to_end_time', 0.0),
-                        'error': None
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'error': result.get('detail', 'Unknown error'),
-                        'transcription': '',
-                        'confidence': 0.0
-                    }
+                return self._build_result(json_loads(response.content))
             else:
-                return {
-                    'success': False,
-                    'error': f"HTTP {response.status_code}: {response.text}",
-                    'transcription': '',
-                    'confidence': 0.0
-                }
+                return self._build_error_result(f"HTTP {response.status_code}: {response.text}")
         
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'transcription': '',
-                'confidence': 0.0
-            }
+            return self._build_error_result(str(e))
     
-    def get_service_status(self) -> Dict:
-        """Get service status and model information"""
+    async def atranscribe_audio(self, audio_file_path: str, model_id: str, language_code: str = 'hi') -> Dict:
+        """Async variant of transcribe_audio built on a shared aiohttp session"""
+        result = await self.atranscribe(audio_file_path, model_id, language_code)
+        return result.to_dict()
+    
+    async def atranscribe(self, audio_file_path: str, model_id: str, language_code: str = 'hi') -> TranscriptionResult:
+        """Async variant of transcribe"""
+        if aiohttp is None:
+            return self._build_error_result('aiohttp is not installed; async transcription is unavailable')
+        
         try:
-            url = f"{self.base_url}/status"
-            response = requests.get(url)
+            url = self._url_upload
+            data = self._build_form_data(model_id, language_code)
+            
+            # Read the file off the event loop thread
+            audio_content = await asyncio.to_thread(self._read_audio_file, audio_file_path)
+            
+            form = aiohttp.FormData()
+            for field, value in data.items():
+                form.add_field(field, value)
+            form.add_field('audio', audio_content,
+                           filename=os.path.basename(audio_file_path),
+                           content_type='application/octet-stream')
+            
+            session = self._get_aio_session()
+            async with session.post(url, data=form) as response:
+                if response.status == 200:
+                    return self._build_result(json_loads(await response.read()))
+                return self._build_error_result(f"HTTP {response.status}: {await response.text()}")
+        
+        except Exception as e:
+            return self._build_error_result(str(e))
+    
+    def _get_aio_session(self):
+        """Lazily create the aiohttp session; must be called from a running event loop"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300)
+            )
+        return self._aio_session
+    
+    async def aclose(self):
+        """Close the aiohttp session used by the async API"""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+    
+    def _read_audio_file(self, audio_file_path: str) -> bytes:
+        """Read an audio file into memory"""
+        with open(audio_file_path, 'rb') as audio_file:
+            return audio_file.read()
+    
+    def _build_form_data(self, model_id: str, language_code: str) -> Dict[str, str]:
+        """Build the upload form fields for a model and language"""
+        # Parse model preferences from model_id
+        model_preference = None
+        decoding_strategy = 'ctc'
+        
+        if 'hindi-specific' in model_id:
+            model_preference = 'hindi-specific'
+        elif 'hindi-multilingual' in model_id:
+            model_preference = 'hindi-multilingual'
+        
+        if 'rnnt' in model_id:
+            decoding_strategy = 'rnnt'
+        
+        # Map language code to Sarv format
+        sarv_language_code = self._map_language_code(language_code)
+        
+        data = {
+            'language': sarv_language_code,
+            'decoding_strategy': decoding_strategy,
+            'debug': 'true'  # Enable debug mode for detailed timing
+        }
+        
+        if model_preference:
+            data['model_preference'] = model_preference
+        
+        return data
+    
+    def _build_result(self, result: Dict) -> TranscriptionResult:
+        """Convert a Sarv /upload response body into the standard result format"""
+        if result.get('success', False):
+            return TranscriptionResult(
+                success=True,
+                transcription=result.get('transcription', ''),
+                confidence=1.0,  # Sarv doesn't provide confidence scores
+                processing_time=result.get('processing_time', 0.0),
+                audio_duration=result.get('audio_duration', 0.0),
+                model_used=result.get('model_used', 'Unknown'),
+                details={
+                    'real_time_factor': result.get('real_time_factor', 0.0),
+                    'end_to_end_time': result.get('end_to_end_time', 0.0)
+                }
+            )
+        
+        return self._build_error_result(result.get('detail', 'Unknown error'))
+    
+    def _build_error_result(self, error: str) -> TranscriptionResult:
+        """Build the standard failure response"""
+        return TranscriptionResult(success=False, error=error)
+    
+    def get_service_status(self, use_cache: bool = True) -> Dict:
+        """Get service status and model information
+
+        Probe results are reused for STATUS_CACHE_TTL seconds so that
+        preflight checks do not add a round trip to every request; pass
+        use_cache=False to force a fresh probe.
+        """
+        now = time.monotonic()
+        if use_cache and self._status_cache is not None and now - self._status_ts < STATUS_CACHE_TTL:
+            return self._status_cache
+        
+        status = self._probe_service_status()
+        self._status_cache = status
+        self._status_ts = time.monotonic()
+        return status
+    
+    def _probe_service_status(self) -> Dict:
+        """Query the service status endpoint"""
+        try:
+            url = self._url_status
+            response = self.session.get(url)
             
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             else:
                 return {
                     'error': f"HTTP {response.status_code}: {response.text}",
                     'model_loaded': False
                 }
         
-        except Exception as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {
                 'error': str(e),
                 'model_loaded': False
@@ -220,13 +302,9 @@ class SarvASR:
         """Get supported languages"""
         return self.supported_languages
     
-    def is_service_available(self) -> bool:
+    def is_service_available(self, use_cache: bool = True) -> bool:
         """Check if the Sarv ASR service is available"""
-        try:
-            status = self.get_service_status()
-            return status.get('model_loaded', False)
-        except:
-            return False
+        return self.get_service_status(use_cache).get('model_loaded', False)
     
     def get_language_name(self, language_code: str) -> str:
         """Get language name from language code"""
@@ -1,57 +1,150 @@
 import requests
-import json
+from urllib3.util.retry import Retry
+import re
+import logging
 import time
+import functools
+import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-import sys
-import os
-# Add TTS base provider to path
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from providers.TTS.base_tts_provider import BaseTTSProvider
+from providers.core.audio_cache import audio_cache_key
+from providers.core.json_codec import json_dumps, json_loads
+from providers.core.results import TTSResult
+from providers.core.ttl_cache import ttl_cache
+
 try:
-    from base_tts_provider import BaseTTSProvider
+    import aiohttp
 except ImportError:
-    # Fallback for standalone usage
-    BaseTTSProvider = object
+    # Async API is optional; the sync API only needs requests
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# ElevenLabs also answers 429/500 under load; urllib3 never retries the
+# synthesis POST, so only the idempotent catalog and status calls are retried
+API_RETRY = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+
+# Seconds a service-status probe result is reused before probing again
+STATUS_CACHE_TTL = 5.0
+
+# Bytes read per iteration when streaming synthesized audio
+STREAM_CHUNK_SIZE = 65536
+
+# Default number of concurrent requests issued by asynthesize_batch and chunked synthesis
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Minimum keep-alive connections held open to the API host
+DEFAULT_POOL_SIZE = 20
+
+# Seconds the model and voice catalogs are reused before refetching
+CATALOG_CACHE_TTL = 300.0
+
+# Average speaking rate used to estimate audio duration (~150 words per minute)
+SPEECH_CHARS_PER_SECOND = 15.0
+
+# Output formats accepted by validate_parameters
+VALID_AUDIO_FORMATS = frozenset({'mp3', 'wav', 'pcm'})
+
+# Shared validate_parameters result for valid input; treat as read-only
+_VALID_RESULT = {'valid': True, 'errors': ()}
+
+# Text length limit used when the config does not list one per model
+DEFAULT_MAX_TEXT_LENGTH = 2500
+
+# Target chunk size when synthesize_long splits text at sentence boundaries
+LONG_TEXT_CHUNK_CHARS = 2000
+
+# Voice settings sent with every synthesis request; never mutate in place
+DEFAULT_VOICE_SETTINGS = {
+    "stability": 0.75,
+    "similarity_boost": 0.75,
+    "style": 0.0,
+    "use_speaker_boost": True
+}
 
-class ElevenLabsTTS:
+# Well-known premade voice names used when a voice has no gender label
+_MALE_NAMES = frozenset({'adam', 'antoni', 'arnold', 'josh', 'sam', 'ethan', 'brian', 'daniel'})
+_FEMALE_NAMES = frozenset({'rachel', 'domi', 'bella', 'elli', 'emily', 'sarah', 'nicole', 'jessica'})
+_NAME_TOKEN_RE = re.compile(r'[a-z]+')
+
+# Whitespace that follows a sentence terminator or a line break
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?\n])\s+')
+
+@functools.lru_cache(maxsize=1024)
+def _detect_gender_from_name(name: str) -> str:
+    """Guess a voice's gender from the words in its name"""
+    tokens = set(_NAME_TOKEN_RE.findall(name.lower()))
+    if tokens & _MALE_NAMES:
+        return 'male'
+    if tokens & _FEMALE_NAMES:
+        return 'female'
+    return 'unknown'
+
+class ElevenLabsTTS(BaseTTSProvider):
     """ElevenLabs Text-to-Speech provider"""
     
+    cache_name = 'elevenlabs'
+    
+    # Synthesis always runs on the default model, so its query string never changes
+    _SYNTHESIS_MODEL_ID = "eleven_multilingual_v2"
+    _SYNTHESIS_PARAMS = {"model_id": _SYNTHESIS_MODEL_ID}
+    
     def __init__(self, config: dict, api_key: str = None):
-        self.config = config
-        self.api_key = api_key
-        self.provider_name = config['provider']['name']
+        super().__init__(config, api_key)
         self.base_url = "https://api.elevenlabs.io/v1"
+        self._url_models = self.base_url + '/models'
+        self._url_voices = self.base_url + '/voices'
+        self._url_user = self.base_url + '/user'
+        self._url_tts = self.base_url + '/text-to-speech/'
         self.headers = {
             "xi-api-key": self.api_key,
             "Content-Type": "application/json"
         }
+        
+        # Keep-alive session shared by every instance using the same API key,
+        # so the TCP/TLS connection is reused across instances. The pool is at
+        # least as large as the request fan-out so concurrent chunks never
+        # discard connections and pay a fresh TLS handshake. The shared pool is
+        # closed by close_shared_sessions(), not per instance.
+        self._max_concurrency = config['provider'].get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
+        self._pool_size = max(DEFAULT_POOL_SIZE, self._max_concurrency)
+        self.session = self.session_for(self.base_url, self.headers,
+                                        pool_maxsize=self._pool_size, max_retries=API_RETRY)
+        
+        self._status_cache = None
+        self._status_ts = 0.0
+        self._aio_session = None
+        self._ttl_cache = {}
+        self._langs = None
+        self._lang_set = frozenset()
+        self._max_text_length = max(
+            (model.get('max_characters', DEFAULT_MAX_TEXT_LENGTH) for model in config.get('models', [])),
+            default=DEFAULT_MAX_TEXT_LENGTH
+        )
     
     def get_available_models(self) -> List[Dict]:
         """Get available TTS models from ElevenLabs"""
         try:
-            response = requests.get(
-                f"{self.base_url}/models",
-                headers=self.headers,
-                timeout=10
-            )
+            models_data = self._fetch_models_data()
+            models = []
             
-            if response.status_code == 200:
-                models_data = response.json()
-                models = []
-                
-                for model in models_data:
-                    models.append({
-                        'id': model.get('model_id', ''),
-                        'name': model.get('name', ''),
-                        'description': model.get('description', ''),
-                        'supported_formats': ['mp3', 'wav', 'pcm'],
-                        'max_characters': model.get('max_characters_request_free', 2500),
-                        'features': model.get('languages', [])
-                    })
-                
-                return models
+            for model in models_data:
+                models.append({
+                    'id': model.get('model_id', ''),
+                    'name': model.get('name', ''),
+                    'description': model.get('description', ''),
+                    'supported_formats': ['mp3', 'wav', 'pcm'],
+                    'max_characters': model.get('max_characters_request_free', 2500),
+                    'features': model.get('languages', [])
+                })
             
-        except Exception as e:
-            print(f"Failed to get ElevenLabs models: {e}")
+            return models
+        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning("Failed to get ElevenLabs models: %s", e)
         
         # Return fallback models
         return [
@@ -76,75 +169,86 @@ class ElevenLabsTTS:
     def get_available_voices(self, language_code: str = 'en-US') -> List[Dict]:
         """Get available voices for ElevenLabs TTS"""
         try:
-            response = requests.get(
-                f"{self.base_url}/voices",
-                headers=self.headers,
-                timeout=10
-            )
+            voices_data = self._fetch_voices_data()
+            voices = []
             
-            if response.status_code == 200:
-                voices_data = response.json()
-                voices = []
-                
-                # Get comprehensive language support from config
-                comprehensive_languages = self._get_comprehensive_languages()
-                
-                for voice in voices_data.get('voices', []):
-                    # ElevenLabs voices work with multiple languages - use comprehensive list
-                    voice_data = {
-                        'id': voice.get('voice_id', ''),
-                        'name': voice.get('name', ''),
-                        'description': voice.get('description', ''),
-                        'gender': self._detect_gender(voice.get('name', ''), voice.get('labels', {})),
-                        'accent': voice.get('labels', {}).get('accent', 'american'),
-                        'age': voice.get('labels', {}).get('age', 'young adult'),
-                        'supported_languages': comprehensive_languages,
-                        'preview_url': voice.get('preview_url', ''),
-                        'category': voice.get('category', 'premade')
-                    }
-                    
-                    # Filter voices that support the requested language
-                    if language_code in comprehensive_languages:
-                        voices.append(voice_data)
-                
+            # Get comprehensive language support from config
+            comprehensive_languages = self._get_comprehensive_languages()
+            
+            # Every voice shares the same language list, so filter once
+            if language_code not in self._lang_set:
                 return voices
             
-        except Exception as e:
-            print(f"Failed to get ElevenLabs voices: {e}")
+            for voice in voices_data.get('voices', []):
+                # ElevenLabs voices work with multiple languages - use comprehensive list
+                voice_data = {
+                    'id': voice.get('voice_id', ''),
+                    'name': voice.get('name', ''),
+                    'description': voice.get('description', ''),
+                    'gender': self._detect_gender(voice.get('name', ''), voice.get('labels', {})),
+                    'accent': voice.get('labels', {}).get('accent', 'american'),
+                    'age': voice.get('labels', {}).get('age', 'young adult'),
+                    'supported_languages': comprehensive_languages,
+                    'preview_url': voice.get('preview_url', ''),
+                    'category': voice.get('category', 'premade')
+                }
+                voices.append(voice_data)
+            
+            return voices
+        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning("Failed to get ElevenLabs voices: %s", e)
         
         # Return fallback voices
         return self._get_fallback_voices(language_code)
     
+    @ttl_cache(CATALOG_CACHE_TTL)
+    def _fetch_models_data(self) -> List[Dict]:
+        """Fetch the raw model list; raises on failure so errors are never cached"""
+        response = self.session.get(
+            self._url_models,
+            timeout=10
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+    
+    @ttl_cache(CATALOG_CACHE_TTL)
+    def _fetch_voices_data(self) -> Dict:
+        """Fetch the raw voice catalog; raises on failure so errors are never cached"""
+        response = self.session.get(
+            self._url_voices,
+            timeout=10
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+    
     def _detect_gender(self, name: str, labels: Dict) -> str:
         """Detect gender from voice name and labels"""
         gender = labels.get('gender', '').lower()
-        if gender in ['male', 'female']:
+        if gender in ('male', 'female'):
             return gender
         
         # Try to detect from name
-        male_names = ['adam', 'antoni', 'arnold', 'josh', 'sam', 'ethan', 'brian', 'daniel']
-        female_names = ['rachel', 'domi', 'bella', 'elli', 'emily', 'sarah', 'nicole', 'jessica']
-        
-        name_lower = name.lower()
-        if any(male_name in name_lower for male_name in male_names):
-            return 'male'
-        elif any(female_name in name_lower for female_name in female_names):
-            return 'female'
-        
-        return 'unknown'
+        return _detect_gender_from_name(name)
     
     def _get_comprehensive_languages(self) -> List[str]:
-        """Get comprehensive language support from config"""
+        """Get comprehensive language support from config, resolved once per instance"""
+        if self._langs is not None:
+            return self._langs
+        
+        # Fallback to basic languages if config loading fails
+        langs = ["en-US", "en-GB"]
         try:
             # Always read from config to follow DRY principle
             if hasattr(self, 'config') and 'supported_languages' in self.config:
-                return self.config['supported_languages']
-        except:
+                langs = self.config['supported_languages']
+        except TypeError:
             pass
         
-        # Fallback to basic languages if config loading fails
-        return ["en-US", "en-GB"]
-
+        self._langs = langs
+        self._lang_set = frozenset(langs)
+        return langs
+    
     def _get_fallback_voices(self, language_code: str = 'en-US') -> List[Dict]:
         """Get fallback voices when API call fails"""
         comprehensive_languages = self._get_comprehensive_languages()
@@ -183,7 +287,7 @@ class ElevenLabsTTS:
         ]
         
         # Filter fallback voices by requested language
-        if language_code in comprehensive_languages:
+        if language_code in self._lang_set:
             return fallback_voices
         else:
             # If language not supported, return empty list
@@ -192,120 +296,318 @@ class ElevenLabsTTS:
     def generate_speech(self, text: str, voice_id: str, model_id: str = 'eleven_multilingual_v2', 
                        language_code: str = 'en-US', audio_format: str = 'mp3', speed: float = 1.0) -> Dict:
         """Generate speech using ElevenLabs TTS API - main method called by backend"""
-        return self.synthesize_speech(text, voice_id, language_code, audio_format, speed)
+        return self.synthesize_speech(text, voice_id, language_code, audio_format, speed,
+                                      return_data_url=True)
     
     def synthesize_speech(self, text: str, voice_id: str, language_code: str = 'en-US',
-                         audio_format: str = 'mp3', speed: float = 1.0) -> Dict:
-        """Synthesize speech using ElevenLabs TTS API"""
+                         audio_format: str = 'mp3', speed: float = 1.0,
+                         return_data_url: bool = False, validate: bool = True) -> Dict:
+        """Synthesize speech using ElevenLabs TTS API and return the standard response dict"""
+        return self.synthesize(text, voice_id, language_code, audio_format, speed,
+                               return_data_url, validate).to_dict()
+    
+    def synthesize(self, text: str, voice_id: str, language_code: str = 'en-US',
+                   audio_format: str = 'mp3', speed: float = 1.0,
+                   return_data_url: bool = False, validate: bool = True) -> TTSResult:
+        """Synthesize speech using ElevenLabs TTS API
+        
+        Results are cached on disk by a hash of the synthesis inputs, so a
+        repeated request is served without calling the API.
+        The audio body is streamed into a single buffer and the cache file. The base64 data URL
+        is only built when return_data_url is set, since it costs a full
+        copy of the audio and callers that read audio_data do not need it.
+        generate_speech opts in because the web UI plays the data URL.
+        Callers that have already checked their inputs can pass
+        validate=False to skip validate_parameters.
+        """
         try:
             # Validate parameters
-            validation = self.validate_parameters(text, voice_id, language_code, audio_format, speed)
-            if not validation['valid']:
-                return {
-                    'success': False,
-                    'error': '; '.join(validation['errors']),
-                    'audio_data': None,
-                    'audio_size_bytes': 0,
-                    'processing_time': 0.0
-                }
+            if validate:
+                validation = self.validate_parameters(text, voice_id, language_code, audio_format, speed)
+                if not validation['valid']:
+                    return self._build_error_result('; '.join(validation['errors']))
             
-            start_time = time.time()
+            # Use default model for synthesis
+            model_id = self._SYNTHESIS_MODEL_ID
             
-            # Prepare request payload
-            payload = {
-                "text": text,
-                "voice_settings": {
-                    "stability": 0.75,
-                    "similarity_boost": 0.75,
-                    "style": 0.0,
-                    "use_speaker_boost": True
-                }
-            }
+            # Identical inputs produce identical audio, so serve repeats from disk
+            cache_key = audio_cache_key(text, voice_id, audio_format, speed, model_id)
+            cached_audio = self._audio_cache.get(cache_key, audio_format)
+            if cached_audio is not None:
+                return self._build_success_result(text, voice_id, model_id, audio_format, speed,
+                                                  cached_audio, 0.0, return_data_url)
             
-            # Add speed control if supported (newer models)
-            if speed != 1.0:
-                payload["voice_settings"]["speed"] = speed
+            start_time = time.perf_counter()
             
-            # Use default model for synthesis
-            model_id = "eleven_multilingual_v2"
+            payload = self._build_payload(text, speed)
             
             # Make API request
-            response = requests.post(
-                f"{self.base_url}/text-to-speech/{voice_id}",
-                headers=self.headers,
-                json=payload,
-                params={"model_id": model_id},
+            response = self.session.post(
+                self._url_tts + voice_id,
+                data=json_dumps(payload),
+                params=self._SYNTHESIS_PARAMS,
+                stream=True,
                 timeout=30
             )
             
-            end_time = time.time()
-            processing_time = end_time - start_time
-            
             if response.status_code == 200:
-                audio_data = response.content
-                audio_size = len(audio_data)
+                # Write each chunk to the cache file as it arrives
+                audio_buffer = bytearray()
+                with self._audio_cache.writer(cache_key, audio_format) as cache_file:
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        audio_buffer.extend(chunk)
+                        cache_file.write(chunk)
+                audio_data = bytes(audio_buffer)
                 
-                # Create data URL for immediate playback (for compatibility with frontend)
-                import base64
-                audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-                audio_url = f"data:audio/{audio_format};base64,{audio_base64}"
+                end_time = time.perf_counter()
+                processing_time = end_time - start_time
                 
-                # Estimate audio duration
-                words = len(text.split())
-                estimated_duration = (words / 150) * 60 / speed
-                
-                return {
-                    'success': True,
-                    'audio_data': audio_data,
-                    'audio_url': audio_url,
-                    'audio_size_bytes': audio_size,
-                    'audio_duration': estimated_duration,
-                    'processing_time': processing_time,
-                    'model_used': model_id,
-                    'voice_used': voice_id,
-                    'format': audio_format,
-                    'text_length': len(text),
-                    'character_count': len(text),
-                    'error': None
-                }
+                return self._build_success_result(text, voice_id, model_id, audio_format, speed,
+                                                  audio_data, processing_time, return_data_url)
             else:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                try:
-                    error_data = response.json()
-                    if 'detail' in error_data:
-                        error_msg = error_data['detail'].get('message', error_msg)
-                except:
-                    pass
+                end_time = time.perf_counter()
+                processing_time = end_time - start_time
                 
-                return {
-                    'success': False,
-                    'error': error_msg,
-                    'audio_data': None,
-                    'audio_size_bytes': 0,
-                    'processing_time': processing_time
-                }
+                error_msg = self._parse_error_message(response.status_code, response.text)
+                return self._build_error_result(error_msg, processing_time)
         
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'audio_data': None,
-                'audio_size_bytes': 0,
-                'processing_time': 0.0
-            }
+            return self._build_error_result(str(e))
+    
+    async def asynthesize_speech(self, text: str, voice_id: str, language_code: str = 'en-US',
+                                 audio_format: str = 'mp3', speed: float = 1.0,
+                                 return_data_url: bool = False, validate: bool = True) -> Dict:
+        """Async variant of synthesize_speech built on a shared aiohttp session"""
+        result = await self.asynthesize(text, voice_id, language_code, audio_format, speed,
+                                        return_data_url, validate)
+        return result.to_dict()
     
-    def get_service_status(self) -> Dict:
-        """Check ElevenLabs TTS service status"""
+    async def asynthesize(self, text: str, voice_id: str, language_code: str = 'en-US',
+                          audio_format: str = 'mp3', speed: float = 1.0,
+                          return_data_url: bool = False, validate: bool = True) -> TTSResult:
+        """Async variant of synthesize"""
+        if aiohttp is None:
+            return self._build_error_result('aiohttp is not installed; async synthesis is unavailable')
+        
         try:
-            # Test with a simple user info call
-            response = requests.get(
-                f"{self.base_url}/user",
+            if validate:
+                validation = self.validate_parameters(text, voice_id, language_code, audio_format, speed)
+                if not validation['valid']:
+                    return self._build_error_result('; '.join(validation['errors']))
+            
+            model_id = self._SYNTHESIS_MODEL_ID
+            
+            cache_key = audio_cache_key(text, voice_id, audio_format, speed, model_id)
+            cached_audio = await asyncio.to_thread(self._audio_cache.get, cache_key, audio_format)
+            if cached_audio is not None:
+                return self._build_success_result(text, voice_id, model_id, audio_format, speed,
+                                                  cached_audio, 0.0, return_data_url)
+            
+            start_time = time.perf_counter()
+            
+            payload = self._build_payload(text, speed)
+            
+            session = self._get_aio_session()
+            # The slot caps in-flight requests per instance, shared with asynthesize_batch
+            async with self._request_slot(), session.post(
+                self._url_tts + voice_id,
+                data=json_dumps(payload),
+                params=self._SYNTHESIS_PARAMS,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    audio_buffer = bytearray()
+                    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                        audio_buffer.extend(chunk)
+                    audio_data = bytes(audio_buffer)
+                    processing_time = time.perf_counter() - start_time
+                    await asyncio.to_thread(self._audio_cache.put, cache_key, audio_format, audio_data)
+                    return self._build_success_result(text, voice_id, model_id, audio_format, speed,
+                                                      audio_data, processing_time, return_data_url)
+                
+                body = await response.text()
+                processing_time = time.perf_counter() - start_time
+                error_msg = self._parse_error_message(response.status, body)
+                return self._build_error_result(error_msg, processing_time)
+        
+        except Exception as e:
+            return self._build_error_result(str(e))
+    
+    def synthesize_long(self, text: str, voice_id: str, language_code: str = 'en-US',
+                        audio_format: str = 'mp3', speed: float = 1.0,
+                        return_data_url: bool = False) -> Dict:
+        """Synthesize text longer than the per-request limit
+        
+        The text is split at sentence boundaries and the chunks are
+        synthesized concurrently on the pooled session, so the wall time is
+        close to the slowest chunk rather than the sum. The audio parts are
+        appended in order, which is valid for MP3 and raw PCM output.
+        """
+        start_time = time.perf_counter()
+        chunks = self._split_text(text, min(LONG_TEXT_CHUNK_CHARS, self._max_text_length))
+        if not chunks:
+            return self._build_error_result('Text cannot be empty').to_dict()
+        
+        max_workers = min(len(chunks), self._max_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda chunk: self.synthesize(chunk, voice_id, language_code, audio_format, speed),
+                chunks
+            ))
+        processing_time = time.perf_counter() - start_time
+        
+        for result in results:
+            if not result.success:
+                return self._build_error_result(result.error, processing_time).to_dict()
+        
+        audio_data = b''.join(result.audio_data for result in results)
+        return self._build_success_result(text, voice_id, self._SYNTHESIS_MODEL_ID, audio_format, speed,
+                                          audio_data, processing_time, return_data_url).to_dict()
+    
+    def _split_text(self, text: str, max_chars: int) -> List[str]:
+        """Greedily pack sentences into chunks of at most max_chars characters"""
+        chunks = []
+        current = ''
+        for sentence in _SENTENCE_BREAK_RE.split(text.strip()):
+            if not sentence:
+                continue
+            candidate = f"{current} {sentence}" if current else sentence
+            if len(candidate) <= max_chars:
+                current = candidate
+                continue
+            
+            if current:
+                chunks.append(current)
+            # A single sentence over the limit is cut at the last space that fits
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(' ', 0, max_chars + 1)
+                if cut <= 0:
+                    cut = max_chars
+                chunks.append(sentence[:cut].rstrip())
+                sentence = sentence[cut:].lstrip()
+            current = sentence
+        
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    async def asynthesize_batch(self, items: List[Dict]) -> List[Dict]:
+        """Synthesize several utterances concurrently
+        
+        Each item holds asynthesize_speech keyword arguments. Requests share
+        the provider.max_concurrency gate of asynthesize_speech, so concurrent
+        batches and single calls never exceed it together. Results are
+        returned in input order and a failed item yields its own error
+        response without failing the rest of the batch.
+        """
+        async def synthesize_one(item: Dict) -> Dict:
+            # Bad keyword arguments raise here, inside the task, not while gathering
+            return await self.asynthesize_speech(**item)
+        
+        results = await asyncio.gather(*(synthesize_one(item) for item in items), return_exceptions=True)
+        return [
+            self._build_error_result(str(result)).to_dict() if isinstance(result, BaseException) else result
+            for result in results
+        ]
+    
+    def _get_aio_session(self):
+        """Lazily create the aiohttp session; must be called from a running event loop"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
                 headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=self._pool_size, ttl_dns_cache=300)
+            )
+        return self._aio_session
+    
+    async def aclose(self):
+        """Close the aiohttp session used by the async API"""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+    
+    def _build_payload(self, text: str, speed: float) -> Dict:
+        """Build the text-to-speech request body"""
+        # The default settings are shared across calls; only copy them to add a speed
+        voice_settings = DEFAULT_VOICE_SETTINGS
+        
+        # Add speed control if supported (newer models)
+        if speed != 1.0:
+            voice_settings = {**DEFAULT_VOICE_SETTINGS, "speed": speed}
+        
+        return {"text": text, "voice_settings": voice_settings}
+    
+    def _build_success_result(self, text: str, voice_id: str, model_id: str, audio_format: str,
+                              speed: float, audio_data: bytes, processing_time: float,
+                              return_data_url: bool) -> TTSResult:
+        """Build the standard success response for synthesized audio"""
+        # Create data URL for immediate playback (for compatibility with frontend)
+        audio_url = self._build_data_url(audio_data, audio_format) if return_data_url else None
+        
+        # Estimate audio duration from the character count, which also holds
+        # for scripts that are not space separated
+        estimated_duration = len(text) / SPEECH_CHARS_PER_SECOND / speed
+        
+        return TTSResult(
+            success=True,
+            audio_data=audio_data,
+            audio_url=audio_url,
+            audio_size_bytes=len(audio_data),
+            audio_duration=estimated_duration,
+            processing_time=processing_time,
+            model_used=model_id,
+            voice_used=voice_id,
+            format=audio_format,
+            text_length=len(text),
+            character_count=len(text)
+        )
+    
+    def _build_error_result(self, error: str, processing_time: float = 0.0) -> TTSResult:
+        """Build the standard failure response"""
+        return TTSResult(success=False, error=error, processing_time=processing_time)
+    
+    def _parse_error_message(self, status_code: int, body: str) -> str:
+        """Extract the API error message from a failed response body"""
+        error_msg = f"HTTP {status_code}: {body}"
+        try:
+            error_data = json_loads(body)
+            if 'detail' in error_data:
+                error_msg = error_data['detail'].get('message', error_msg)
+        except (ValueError, AttributeError, TypeError):
+            pass
+        return error_msg
+    
+    def _build_data_url(self, audio_data: bytes, audio_format: str) -> str:
+        """Encode audio bytes as a data URL for direct playback in the browser"""
+        audio_base64 = base64.b64encode(memoryview(audio_data)).decode('ascii')
+        return f"data:audio/{audio_format};base64,{audio_base64}"
+    
+    def get_service_status(self, use_cache: bool = True) -> Dict:
+        """Check ElevenLabs TTS service status
+        
+        Probe results are reused for STATUS_CACHE_TTL seconds so that
+        preflight checks do not add a round trip to every request; pass
+        use_cache=False to force a fresh probe.
+        """
+        now = time.monotonic()
+        if use_cache and self._status_cache is not None and now - self._status_ts < STATUS_CACHE_TTL:
+            return self._status_cache
+        
+        status = self._probe_service_status()
+        self._status_cache = status
+        self._status_ts = time.monotonic()
+        return status
+    
+    def _probe_service_status(self) -> Dict:
+        """Query the service status endpoint"""
+        try:
+            # Test with a simple user info call
+            response = self.session.get(
+                self._url_user,
                 timeout=10
             )
             
             if response.status_code == 200:
-                user_data = response.json()
+                user_data = json_loads(response.content)
                 return {
                     'service_available': True,
                     'status': 'Active',
@@ -322,7 +624,7 @@ class ElevenLabsTTS:
                     'error': response.text
                 }
         
-        except Exception as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {
                 'service_available': False,
                 'status': 'Error',
@@ -330,45 +632,46 @@ class ElevenLabsTTS:
                 'error': str(e)
             }
     
-    def is_service_available(self) -> bool:
+    def is_service_available(self, use_cache: bool = True) -> bool:
         """Check if ElevenLabs TTS service is available"""
-        try:
-            status = self.get_service_status()
-            return status.get('service_available', False)
-        except:
-            return False
+        return self.get_service_status(use_cache).get('service_available', False)
     
     def get_voice_info(self, voice_id: str) -> Dict:
         """Get detailed information about a specific voice"""
         try:
-            response = requests.get(
-                f"{self.base_url}/voices/{voice_id}",
-                headers=self.headers,
+            response = self.session.get(
+                f"{self._url_voices}/{voice_id}",
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             else:
                 return {'error': f'HTTP {response.status_code}: {response.text}'}
-                
+        
         except Exception as e:
             return {'error': str(e)}
     
     def validate_parameters(self, text: str, voice_id: str, language_code: str, 
                           audio_format: str, speed: float) -> Dict:
         """Validate synthesis parameters"""
+        # Fast path for the common case where everything is valid
+        if (text and voice_id and audio_format in VALID_AUDIO_FORMATS
+                and 0.5 <= speed <= 2.0 and len(text) <= self._max_text_length
+                and not text.isspace()):
+            return _VALID_RESULT
+        
         errors = []
         
-        if not text or not text.strip():
+        if not text or text.isspace():
             errors.append("Text cannot be empty")
-        elif len(text) > 2500:
-            errors.append("Text too long (max 2500 characters for free tier)")
+        elif len(text) > self._max_text_length:
+            errors.append(f"Text too long (max {self._max_text_length} characters for free tier)")
         
         if not voice_id:
             errors.append("Voice ID is required")
         
-        if audio_format not in ['mp3', 'wav', 'pcm']:
+        if audio_format not in VALID_AUDIO_FORMATS:
             errors.append("Invalid audio format. Supported: mp3, wav, pcm")
         
         if speed < 0.5 or speed > 2.0:
@@ -1,98 +1,364 @@
-import json
 import time
+import functools
+import asyncio
 import base64
+import gzip
+import logging
+import threading
 import requests
-from typing import List, Dict, Optional
-import sys
-import os
-# Add TTS base provider to path
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple
+
+from providers.TTS.base_tts_provider import BaseTTSProvider
+from providers.core.audio_cache import audio_cache_key
+from providers.core.http_session_pool import get_shared_session
+from providers.core.json_codec import JSONDecodeError, json_dumps, json_loads
+
 try:
-    from base_tts_provider import BaseTTSProvider
+    import aiohttp
 except ImportError:
-    # Fallback for standalone usage
-    BaseTTSProvider = object
+    # Async API is optional; the sync API only needs requests
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Retry rate-limited and transient voice catalog calls; POSTs are not
+# retried by urllib3, so synthesis is never sent twice
+API_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+
+# Headers for API-key requests; Bearer requests add Authorization to a copy
+_JSON_HEADERS = MappingProxyType({'Content-Type': 'application/json'})
+
+# OAuth2 endpoint that exchanges a signed service account JWT for an access token
+OAUTH_TOKEN_URL = 'https://oauth2.googleapis.com/token'
+
+# Lifetime requested for service account tokens (Google's maximum), and how long
+# before expiry a token is replaced
+TOKEN_LIFETIME = 3600
+TOKEN_REFRESH_MARGIN = 300.0
+
+# Seconds to wait before retrying a failed token refresh
+TOKEN_RETRY_DELAY = 30.0
+
+# Access tokens by service account email, shared by every instance in the process
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
+
+# Parsed RSA signing keys by (client_email, private_key_id), guarded by _TOKEN_LOCK
+_SIGNING_KEYS: Dict[Tuple[str, Optional[str]], object] = {}
+
+def _get_signing_key(service_account_info: dict):
+    """Return the parsed private key for a service account, loading the PEM only once"""
+    key_id = (service_account_info['client_email'], service_account_info.get('private_key_id'))
+    with _TOKEN_LOCK:
+        signing_key = _SIGNING_KEYS.get(key_id)
+    if signing_key is None:
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+        signing_key = load_pem_private_key(service_account_info['private_key'].encode('utf-8'), password=None)
+        with _TOKEN_LOCK:
+            _SIGNING_KEYS[key_id] = signing_key
+    return signing_key
+
+# Seconds the voice catalog is reused before revalidating it with the server
+CATALOG_CACHE_TTL = 300.0
+
+# Seconds a service-status probe result, successful or not, is reused
+STATUS_CACHE_TTL = 30.0
+
+# Entries kept per request-parameter cache before it is reset
+PARAMS_CACHE_SIZE = 256
+
+# Voice families that model_filter can select
+_VOICE_TYPES = frozenset({'neural2', 'wavenet', 'standard'})
+
+# SSML genders reported by the voices endpoint; anything else is neutral
+_SSML_GENDERS = {'MALE': 'male', 'FEMALE': 'female'}
+
+# Family segment of a voice name to its display name; other families count as Standard
+_VOICE_FAMILIES = {'Neural2': 'Neural2', 'Wavenet': 'WaveNet'}
+
+@functools.lru_cache(maxsize=2048)
+def _classify_voice(voice_name: str, ssml_gender: str) -> Tuple[str, str, str]:
+    """Map a Google voice name and SSML gender to (voice_type, gender, description)"""
+    # Voice names follow <language>-<region>-<family>-<variant>, e.g. en-US-Wavenet-A
+    parts = voice_name.split('-', 3)
+    family = _VOICE_FAMILIES.get(parts[2], 'Standard') if len(parts) > 2 else 'Standard'
+    gender = _SSML_GENDERS.get(ssml_gender, 'neutral')
+    return family.lower(), gender, f'{family} {gender} voice'
+
+# Output formats and text length accepted by validate_parameters
+VALID_AUDIO_FORMATS = frozenset({'mp3', 'wav', 'ogg'})
+MAX_TEXT_LENGTH = 5000
+
+# Shared validate_parameters result for valid input; treat as read-only
+_VALID_RESULT = {'valid': True, 'errors': ()}
+
+# Average speaking rate used to estimate audio duration (~150 words per minute)
+SPEECH_CHARS_PER_SECOND = 15.0
+
+# Default number of concurrent requests issued by synthesize_batch
+DEFAULT_MAX_CONCURRENCY = 8
 
-class GoogleTTS:
+# Synthesis bodies at least this large are sent gzip-compressed; smaller ones
+# would gain less than the gzip framing costs
+GZIP_MIN_BODY_BYTES = 1024
+
+# Voices offered when the voice catalog cannot be fetched
+_FALLBACK_VOICES = (
+    # Neural2 voices
+    {
+        'id': 'en-US-Neural2-A',
+        'name': 'en-US-Neural2-A',
+        'description': 'Neural2 female voice',
+        'gender': 'female',
+        'language_codes': ['en-US', 'en-GB'],
+        'supported_languages': ['en-US', 'en-GB'],
+        'voice_type': 'neural2'
+    },
+    {
+        'id': 'hi-IN-Neural2-A',
+        'name': 'hi-IN-Neural2-A',
+        'description': 'Neural2 female Hindi voice',
+        'gender': 'female',
+        'language_codes': ['hi-IN'],
+        'supported_languages': ['hi-IN'],
+        'voice_type': 'neural2'
+    },
+    {
+        'id': 'hi-IN-Neural2-B',
+        'name': 'hi-IN-Neural2-B',
+        'description': 'Neural2 male Hindi voice',
+        'gender': 'male',
+        'language_codes': ['hi-IN'],
+        'supported_languages': ['hi-IN'],
+        'voice_type': 'neural2'
+    },
+    # WaveNet voices
+    {
+        'id': 'en-US-Wavenet-A',
+        'name': 'en-US-Wavenet-A',
+        'description': 'WaveNet female voice',
+        'gender': 'female',
+        'language_codes': ['en-US', 'en-GB'],
+        'supported_languages': ['en-US', 'en-GB'],
+        'voice_type': 'wavenet'
+    },
+    {
+        'id': 'hi-IN-Wavenet-A',
+        'name': 'hi-IN-Wavenet-A',
+        'description': 'WaveNet female Hindi voice',
+        'gender': 'female',
+        'language_codes': ['hi-IN'],
+        'supported_languages': ['hi-IN'],
+        'voice_type': 'wavenet'
+    },
+    {
+        'id': 'hi-IN-Wavenet-B',
+        'name': 'hi-IN-Wavenet-B',
+        'description': 'WaveNet male Hindi voice',
+        'gender': 'male',
+        'language_codes': ['hi-IN'],
+        'supported_languages': ['hi-IN'],
+        'voice_type': 'wavenet'
+    },
+    # Standard voices
+    {
+        'id': 'en-US-Standard-A',
+        'name': 'en-US-Standard-A',
+        'description': 'Standard female voice',
+        'gender': 'female',
+        'language_codes': ['en-US', 'en-GB'],
+        'supported_languages': ['en-US', 'en-GB'],
+        'voice_type': 'standard'
+    },
+    {
+        'id': 'hi-IN-Standard-A',
+        'name': 'hi-IN-Standard-A',
+        'description': 'Standard female Hindi voice',
+        'gender': 'female',
+        'language_codes': ['hi-IN'],
+        'supported_languages': ['hi-IN'],
+        'voice_type': 'standard'
+    },
+    {
+        'id': 'hi-IN-Standard-B',
+        'name': 'hi-IN-Standard-B',
+        'description': 'Standard male Hindi voice',
+        'gender': 'male',
+        'language_codes': ['hi-IN'],
+        'supported_languages': ['hi-IN'],
+        'voice_type': 'standard'
+    }
+)
+
+def _build_fallback_index() -> Dict[Tuple[str, Optional[str]], Tuple[Dict, ...]]:
+    """Bucket the fallback voices by (language, voice type), with None for any type"""
+    index = {}
+    for voice in _FALLBACK_VOICES:
+        for language_code in voice['language_codes']:
+            for key in ((language_code, None), (language_code, voice['voice_type'])):
+                index[key] = index.get(key, ()) + (voice,)
+    return index
+
+# Fallback voices by (language_code, voice_type or None); treat as read-only
+_FALLBACK_INDEX = _build_fallback_index()
+
+class GoogleTTS(BaseTTSProvider):
     """Google Cloud Text-to-Speech provider using REST API"""
     
+    cache_name = 'google'
+    
+    # Output format to Google audioEncoding
+    _AUDIO_ENCODINGS = {
+        'mp3': 'MP3',
+        'wav': 'LINEAR16',
+        'ogg': 'OGG_OPUS'
+    }
+    
     def __init__(self, config: dict, api_key: str = None):
-        self.config = config
-        self.api_key = api_key
-        self.provider_name = config['provider']['name']
+        super().__init__(config, api_key)
+        self._max_concurrency = config['provider'].get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
         self.base_url = "https://texttospeech.googleapis.com/v1"
+        self._url_voices = self.base_url + '/voices'
+        self._url_synthesize = self.base_url + '/text:synthesize'
         self.access_token = None
+        
+        # Credentials sent with every request; set once the auth mode is known and
+        # read-only so a request can never alter them for the next one
+        self._auth_headers = _JSON_HEADERS
+        self._auth_params = None
+        self._service_account_info = None
+        self._token_refresh_at = float('inf')
+        
+        # Keep-alive session shared by every instance using the same credentials,
+        # so synthesis calls after the first skip the TCP/TLS handshake
+        self.session = self.session_for(self.base_url, pool_connections=4, pool_maxsize=16,
+                                        max_retries=API_RETRY)
+        self._aio_session = None
+        self._voices_catalog = None  # (catalog, etag, fetched_at)
+        self._status_cache = None
+        self._status_ts = 0.0
+        self._voice_index = None
+        self._voice_params_cache = {}
+        self._audio_config_cache = {}
+        self._payload_tail_cache = {}
+        self._compress_requests = config['provider'].get('compress_requests', True)
         self._initialize_auth()
     
     def _initialize_auth(self):
         """Initialize Google Cloud TTS authentication using REST API"""
         try:
             if not self.api_key:
-                print("Google TTS: No API key provided")
+                logger.warning("Google TTS: No API key provided")
                 self.access_token = None
                 return
-                
+            
             # Parse service account key from API key
             if self.api_key.startswith('{'):
                 # JSON service account key
                 try:
-                    service_account_info = json.loads(self.api_key)
-                    self.access_token = self._get_access_token_from_service_account(service_account_info)
-                    if self.access_token:
-                        print("Google TTS: Successfully authenticated with service account credentials")
+                    service_account_info = json_loads(self.api_key)
+                    self._service_account_info = service_account_info
+                    token = self._get_access_token_from_service_account(service_account_info)
+                    if token:
+                        self._set_bearer_token(token)
+                        logger.info("Google TTS: Authenticated with service account credentials")
                     else:
-                        print("Google TTS: Failed to get access token from service account")
-                except json.JSONDecodeError as e:
-                    print(f"Google TTS: Invalid JSON in service account key: {e}")
+                        logger.warning("Google TTS: Failed to get access token from service account")
+                        self._token_refresh_at = time.time() + TOKEN_RETRY_DELAY
+                except JSONDecodeError as e:
+                    logger.warning("Google TTS: Invalid JSON in service account key: %s", e)
                     self.access_token = None
-                except Exception as e:
-                    print(f"Google TTS: Failed to authenticate with service account key: {e}")
+                except (KeyError, TypeError, AttributeError) as e:
+                    logger.warning("Google TTS: Malformed service account key: %s", e)
+                    self._service_account_info = None
                     self.access_token = None
             else:
                 # Treat as direct API key
-                print("Google TTS: Using API key for authentication")
+                logger.debug("Google TTS: Using API key for authentication")
                 self.access_token = self.api_key
-        except Exception as e:
-            print(f"Failed to initialize Google TTS authentication: {e}")
+                self._auth_params = MappingProxyType({'key': self.api_key})
+        except Exception:
+            logger.exception("Failed to initialize Google TTS authentication")
             self.access_token = None
     
+    def _set_bearer_token(self, token: str):
+        """Use a service account access token for subsequent requests"""
+        self.access_token = token
+        self._auth_headers = MappingProxyType({**_JSON_HEADERS, 'Authorization': f'Bearer {token}'})
+    
+    def _ensure_token_fresh(self):
+        """Replace a service account token that is about to expire"""
+        if time.time() < self._token_refresh_at:
+            return
+        try:
+            token = self._get_access_token_from_service_account(self._service_account_info)
+        except Exception:
+            logger.exception("Failed to refresh Google TTS access token")
+            token = None
+        if token:
+            self._set_bearer_token(token)
+        else:
+            # Keep the current token for its remaining lifetime and retry later
+            self._token_refresh_at = time.time() + TOKEN_RETRY_DELAY
+    
     def _get_access_token_from_service_account(self, service_account_info: dict) -> str:
-        """Get OAuth2 access token from service account credentials"""
+        """Get OAuth2 access token from service account credentials
+        
+        Tokens are cached per service account and reused until shortly before
+        they expire, so new instances and worker restarts skip the RS256
+        signing and the token round trip.
+        """
+        client_email = service_account_info['client_email']
+        with _TOKEN_LOCK:
+            cached = _TOKEN_CACHE.get(client_email)
+        if cached is not None and cached[1] - time.time() > TOKEN_REFRESH_MARGIN:
+            self._token_refresh_at = cached[1] - TOKEN_REFRESH_MARGIN
+            return cached[0]
+        
         try:
             import jwt
-            import time
             
             # Create JWT assertion
             now = int(time.time())
             payload = {
-                'iss': service_account_info['client_email'],
+                'iss': client_email,
                 'scope': 'https://www.googleapis.com/auth/cloud-platform',
-                'aud': 'https://oauth2.googleapis.com/token',
+                'aud': OAUTH_TOKEN_URL,
                 'iat': now,
-                'exp': now + 3600  # 1 hour expiry
+                'exp': now + TOKEN_LIFETIME
             }
             
-            # Sign the JWT
-            private_key = service_account_info['private_key']
-            token = jwt.encode(payload, private_key, algorithm='RS256')
+            # Sign the JWT with the already parsed key
+            token = jwt.encode(payload, _get_signing_key(service_account_info), algorithm='RS256')
             
             # Exchange JWT for access token
-            response = requests.post('https://oauth2.googleapis.com/token', data={
+            response = get_shared_session(OAUTH_TOKEN_URL).post(OAUTH_TOKEN_URL, data={
                 'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
                 'assertion': token
-            })
+            }, timeout=10)
             
             if response.status_code == 200:
-                return response.json().get('access_token')
+                token_data = json_loads(response.content)
+                access_token = token_data.get('access_token')
+                if access_token:
+                    expires_at = now + token_data.get('expires_in', TOKEN_LIFETIME)
+                    with _TOKEN_LOCK:
+                        _TOKEN_CACHE[client_email] = (access_token, expires_at)
+                    self._token_refresh_at = expires_at - TOKEN_REFRESH_MARGIN
+                return access_token
             else:
-                print(f"Failed to get access token: {response.status_code} - {response.text}")
+                logger.warning("Failed to get access token: %s - %s", response.status_code, response.text)
                 return None
-                
+        
         except ImportError:
-            print("PyJWT library not available, falling back to API key method")
+            logger.warning("PyJWT or cryptography library not available, falling back to API key method")
             return None
-        except Exception as e:
-            print(f"Error getting access token: {e}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError covers malformed PEM keys and bad token JSON
+            logger.warning("Error getting access token: %s", e)
             return None
     
     def get_available_models(self) -> List[Dict]:
@@ -123,329 +389,419 @@ class GoogleTTS:
     
     def get_available_voices(self, language_code: str = 'en-US', model_filter: str = None) -> List[Dict]:
         """Get available voices for Google TTS using REST API, optionally filtered by model type"""
+        self._ensure_token_fresh()
         if not self.access_token:
             return self._get_fallback_voices(language_code, model_filter)
         
         try:
-            # Get list of available voices via REST API
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # If access_token looks like an API key (not JWT), use key parameter instead
-            if len(self.access_token) < 100:  # API keys are shorter than JWT tokens
-                url = f"{self.base_url}/voices?key={self.access_token}"
-                headers = {'Content-Type': 'application/json'}
-            else:
-                url = f"{self.base_url}/voices"
+            voices_data = self._fetch_voices_data()
+            expected_type = model_filter.lower() if model_filter else None
+            if expected_type not in _VOICE_TYPES:
+                expected_type = None
             
-            response = requests.get(url, headers=headers, timeout=10)
+            # The index is rebuilt only when the catalog itself changes
+            if self._voice_index is None:
+                self._voice_index = self._build_voice_index(voices_data)
+            return list(self._voice_index.get((language_code, expected_type), ()))
+        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning("Failed to get Google TTS voices: %s", e)
+            return self._get_fallback_voices(language_code, model_filter)
+    
+    def _build_voice_index(self, voices_data: Dict) -> Dict[Tuple[str, Optional[str]], List[Dict]]:
+        """Index catalog voices by (language, voice type), with None for any type
+        
+        Each voice dict is built once and shared by every list it appears in.
+        """
+        index = {}
+        for voice in voices_data.get('voices', []):
+            voice_language_codes = voice.get('languageCodes', [])
+            voice_name = voice.get('name', '')
+            voice_type, gender, description = _classify_voice(voice_name, voice.get('ssmlGender', 'NEUTRAL'))
             
-            if response.status_code == 200:
-                voices_data = response.json()
-                
-                # Get comprehensive language support from config
-                comprehensive_languages = self._get_comprehensive_languages()
-                
-                voices = []
-                for voice in voices_data.get('voices', []):
-                    # Check if voice supports the requested language
-                    voice_language_codes = voice.get('languageCodes', [])
-                    
-                    # Only include voices that actually support the requested language
-                    if language_code not in voice_language_codes:
-                        continue
-                    
-                    voice_name = voice.get('name', '')
-                    voice_type = 'Neural2' if 'Neural2' in voice_name else 'WaveNet' if 'Wavenet' in voice_name else 'Standard'
-                    
-                    # Filter voices by model type if specified
-                    if model_filter:
-                        expected_type = model_filter.lower()
-                        if expected_type == 'neural2' and 'Neural2' not in voice_name:
-                            continue
-                        elif expected_type == 'wavenet' and 'Wavenet' not in voice_name:
-                            continue
-                        elif expected_type == 'standard' and ('Neural2' in voice_name or 'Wavenet' in voice_name):
-                            continue
-                    
-                    # Determine gender from SSML gender
-                    ssml_gender = voice.get('ssmlGender', 'NEUTRAL')
-                    gender = 'male' if ssml_gender == 'MALE' else 'female' if ssml_gender == 'FEMALE' else 'neutral'
-                    
-                    voice_data = {
-                        'id': voice_name,
-                        'name': voice_name,
-                        'description': f'{voice_type} {gender} voice',
-                        'gender': gender,
-                        'language_codes': voice_language_codes,  # Use actual language codes only
-                        'supported_languages': voice_language_codes,  # Use actual language codes only
-                        'voice_type': voice_type.lower()
-                    }
-                    
-                    voices.append(voice_data)
-                
-                return voices
-            else:
-                print(f"Failed to get Google TTS voices: HTTP {response.status_code} - {response.text}")
-                return self._get_fallback_voices(language_code, model_filter)
+            voice_data = {
+                'id': voice_name,
+                'name': voice_name,
+                'description': description,
+                'gender': gender,
+                'language_codes': voice_language_codes,  # Use actual language codes only
+                'supported_languages': voice_language_codes,  # Use actual language codes only
+                'voice_type': voice_type
+            }
             
-        except Exception as e:
-            print(f"Failed to get Google TTS voices: {e}")
-            return self._get_fallback_voices(language_code, model_filter)
+            for language_code in dict.fromkeys(voice_language_codes):
+                index.setdefault((language_code, None), []).append(voice_data)
+                index.setdefault((language_code, voice_type), []).append(voice_data)
+        return index
+    
+    def _fetch_voices_data(self) -> Dict:
+        """Fetch the raw voice catalog; raises on failure so errors are never cached
+        
+        The catalog is reused for CATALOG_CACHE_TTL seconds, then revalidated
+        with If-None-Match so an unchanged catalog costs a 304 instead of a
+        full download and parse.
+        """
+        now = time.monotonic()
+        cached = self._voices_catalog
+        if cached is not None and now - cached[2] < CATALOG_CACHE_TTL:
+            return cached[0]
+        
+        # Get list of available voices via REST API
+        headers = self._auth_headers
+        if cached is not None and cached[1]:
+            headers = {**headers, 'If-None-Match': cached[1]}
+        
+        response = self.session.get(self._url_voices, headers=headers, params=self._auth_params, timeout=10)
+        if response.status_code == 304 and cached is not None:
+            self._voices_catalog = (cached[0], cached[1], now)
+            return cached[0]
+        if response.status_code != 200:
+            raise requests.exceptions.HTTPError(f"HTTP {response.status_code} - {response.text}",
+                                                response=response)
+        
+        voices_data = json_loads(response.content)
+        self._voices_catalog = (voices_data, response.headers.get('ETag'), now)
+        self._voice_index = None
+        return voices_data
     
     def _get_comprehensive_languages(self) -> List[str]:
         """Get comprehensive language support from config"""
-        try:
-            # Always read from config to follow DRY principle
-            if hasattr(self, 'config') and 'supported_languages' in self.config:
-                return self.config['supported_languages']
-        except:
-            pass
+        # Always read from config to follow DRY principle
+        config = getattr(self, 'config', None)
+        if isinstance(config, dict) and 'supported_languages' in config:
+            return config['supported_languages']
         
         # Fallback to basic languages if config loading fails
         return ["en-US", "en-GB"]
-
+    
     def _get_fallback_voices(self, language_code: str, model_filter: str = None) -> List[Dict]:
         """Get fallback voices when API call fails, optionally filtered by model type"""
-        
-        # Enhanced fallback voices with proper language-specific support
-        all_fallback_voices = [
-            # Neural2 voices
-            {
-                'id': 'en-US-Neural2-A',
-                'name': 'en-US-Neural2-A',
-                'description': 'Neural2 female voice',
-                'gender': 'female',
-                'language_codes': ['en-US', 'en-GB'],
-                'supported_languages': ['en-US', 'en-GB'],
-                'voice_type': 'neural2'
-            },
-            {
-                'id': 'hi-IN-Neural2-A',
-                'name': 'hi-IN-Neural2-A',
-                'description': 'Neural2 female Hindi voice',
-                'gender': 'female',
-                'language_codes': ['hi-IN'],
-                'supported_languages': ['hi-IN'],
-                'voice_type': 'neural2'
-            },
-            {
-                'id': 'hi-IN-Neural2-B',
-                'name': 'hi-IN-Neural2-B',
-                'description': 'Neural2 male Hindi voice',
-                'gender': 'male',
-                'language_codes': ['hi-IN'],
-                'supported_languages': ['hi-IN'],
-                'voice_type': 'neural2'
-            },
-            # WaveNet voices
-            {
-                'id': 'en-US-Wavenet-A',
-                'name': 'en-US-Wavenet-A',
-                'description': 'WaveNet female voice',
-                'gender': 'female',
-                'language_codes': ['en-US', 'en-GB'],
-                'supported_languages': ['en-US', 'en-GB'],
-                'voice_type': 'wavenet'
-            },
-            {
-                'id': 'hi-IN-Wavenet-A',
-                'name': 'hi-IN-Wavenet-A',
-                'description': 'WaveNet female Hindi voice',
-                'gender': 'female',
-                'language_codes': ['hi-IN'],
-                'supported_languages': ['hi-IN'],
-                'voice_type': 'wavenet'
-            },
-            {
-                'id': 'hi-IN-Wavenet-B',
-                'name': 'hi-IN-Wavenet-B',
-                'description': 'WaveNet male Hindi voice',
-                'gender': 'male',
-                'language_codes': ['hi-IN'],
-                'supported_languages': ['hi-IN'],
-                'voice_type': 'wavenet'
-            },
-            # Standard voices
-            {
-                'id': 'en-US-Standard-A',
-                'name': 'en-US-Standard-A',
-                'description': 'Standard female voice',
-                'gender': 'female',
-                'language_codes': ['en-US', 'en-GB'],
-                'supported_languages': ['en-US', 'en-GB'],
-                'voice_type': 'standard'
-            },
-            {
-                'id': 'hi-IN-Standard-A',
-                'name': 'hi-IN-Standard-A',
-                'description': 'Standard female Hindi voice',
-                'gender': 'female',
-                'language_codes': ['hi-IN'],
-                'supported_languages': ['hi-IN'],
-                'voice_type': 'standard'
-            },
-            {
-                'id': 'hi-IN-Standard-B',
-                'name': 'hi-IN-Standard-B',
-                'description': 'Standard male Hindi voice',
-                'gender': 'male',
-                'language_codes': ['hi-IN'],
-                'supported_languages': ['hi-IN'],
-                'voice_type': 'standard'
-            }
-        ]
-        
-        # Filter by model type if specified
-        filtered_voices = all_fallback_voices
-        if model_filter:
-            expected_type = model_filter.lower()
-            filtered_voices = [voice for voice in all_fallback_voices if voice['voice_type'] == expected_type]
-        
-        # Filter fallback voices by actual language support
-        language_filtered_voices = []
-        for voice in filtered_voices:
-            # Check if the voice actually supports the requested language
-            if language_code in voice['language_codes']:
-                language_filtered_voices.append(voice)
-        
-        return language_filtered_voices
+        expected_type = model_filter.lower() if model_filter else None
+        return list(_FALLBACK_INDEX.get((language_code, expected_type), ()))
     
     def generate_speech(self, text: str, voice_id: str, model_id: str = 'standard', 
                        language_code: str = 'en-US', audio_format: str = 'mp3', speed: float = 1.0) -> Dict:
         """Generate speech using Google Cloud TTS API - main method called by backend"""
-        return self.synthesize_speech(text, voice_id, language_code, audio_format, speed)
+        # The backend only plays the data URL, so the raw bytes are not needed
+        return self.synthesize_speech(text, voice_id, language_code, audio_format, speed,
+                                      decode_audio=False)
     
     def synthesize_speech(self, text: str, voice_id: str, language_code: str = 'en-US',
-                         audio_format: str = 'mp3', speed: float = 1.0) -> Dict:
-        """Synthesize speech using Google Cloud TTS REST API"""
+                         audio_format: str = 'mp3', speed: float = 1.0, decode_audio: bool = True) -> Dict:
+        """Synthesize speech using Google Cloud TTS REST API
+        
+        With decode_audio=False the response carries only the playback data
+        URL and audio_data is None, and the base64 payload is never decoded.
+        The audio cache stores that payload as returned by the API, so hits
+        and misses build the data URL without a decode/encode round trip.
+        """
+        self._ensure_token_fresh()
         if not self.access_token:
-            error_msg = 'Google TTS not authenticated. '
-            if not self.api_key:
-                error_msg += 'Please configure a Google Cloud API key or service account JSON key in the API Keys section.'
-            else:
-                error_msg += 'Please check your Google Cloud API credentials. Ensure the key has Text-to-Speech API permissions.'
-            
-            return {
-                'success': False,
-                'error': error_msg,
-                'audio_data': None,
-                'audio_size_bytes': 0,
-                'processing_time': 0.0
-            }
+            return self._build_auth_error_result()
         
         try:
             # Validate parameters
             validation = self.validate_parameters(text, voice_id, language_code, audio_format, speed)
             if not validation['valid']:
-                return {
-                    'success': False,
-                    'error': '; '.join(validation['errors']),
-                    'audio_data': None,
-                    'audio_size_bytes': 0,
-                    'processing_time': 0.0
-                }
-            
-            start_time = time.time()
-            
-            # Configure audio format
-            format_mapping = {
-                'mp3': 'MP3',
-                'wav': 'LINEAR16',
-                'ogg': 'OGG_OPUS'
-            }
+                return self._build_error_result('; '.join(validation['errors']))
             
-            # Prepare request payload
-            payload = {
-                'input': {
-                    'text': text
-                },
-                'voice': {
-                    'languageCode': language_code,
-                    'name': voice_id
-                },
-                'audioConfig': {
-                    'audioEncoding': format_mapping.get(audio_format, 'MP3'),
-                    'speakingRate': speed
-                }
-            }
+            # Identical inputs produce identical audio, so serve repeats from disk
+            cache_key = audio_cache_key(text, voice_id, audio_format, speed, language_code)
+            cached_base64 = self._audio_cache.get(cache_key, self._cache_format(audio_format))
+            if cached_base64 is not None:
+                return self._build_cached_result(text, voice_id, audio_format, speed, cached_base64, decode_audio)
             
-            # Set up headers and URL
-            headers = {
-                'Content-Type': 'application/json'
-            }
+            start_time = time.time()
             
-            # If access_token looks like an API key (not JWT), use key parameter instead
-            if len(self.access_token) < 100:  # API keys are shorter than JWT tokens
-                url = f"{self.base_url}/text:synthesize?key={self.access_token}"
-            else:
-                url = f"{self.base_url}/text:synthesize"
-                headers['Authorization'] = f'Bearer {self.access_token}'
+            body, headers = self._encode_request(self._build_payload(text, voice_id, language_code, audio_format, speed))
             
-            # Make API request
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            # Make API request on the pooled connection
+            response = self.session.post(self._url_synthesize, headers=headers, params=self._auth_params,
+                                         data=body, timeout=30)
             
             end_time = time.time()
             processing_time = end_time - start_time
             
             if response.status_code == 200:
-                response_data = response.json()
-                
                 # Get audio content (it's base64 encoded in the response)
-                audio_base64 = response_data.get('audioContent', '')
-                audio_data = base64.b64decode(audio_base64)
-                audio_size = len(audio_data)
+                audio_base64 = json_loads(response.content).get('audioContent', '')
+                self._audio_cache.put(cache_key, self._cache_format(audio_format), audio_base64.encode('ascii'))
+                audio_data = base64.b64decode(audio_base64) if decode_audio else None
                 
-                # Create data URL for immediate playback
-                audio_url = f"data:audio/{audio_format};base64,{audio_base64}"
-                
-                # Estimate audio duration
-                words = len(text.split())
-                estimated_duration = (words / 150) * 60 / speed
-                
-                return {
-                    'success': True,
-                    'audio_data': audio_data,
-                    'audio_url': audio_url,
-                    'audio_size_bytes': audio_size,
-                    'audio_duration': estimated_duration,
-                    'processing_time': processing_time,
-                    'voice_used': voice_id,
-                    'format': audio_format,
-                    'text_length': len(text),
-                    'character_count': len(text),
-                    'error': None
-                }
+                return self._build_success_result(text, voice_id, audio_format, speed,
+                                                  audio_data, audio_base64, processing_time)
             else:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                try:
-                    error_data = response.json()
-                    if 'error' in error_data:
-                        error_msg = error_data['error'].get('message', error_msg)
-                except:
-                    pass
-                
-                return {
-                    'success': False,
-                    'error': error_msg,
-                    'audio_data': None,
-                    'audio_size_bytes': 0,
-                    'processing_time': processing_time
-                }
+                error_msg = self._parse_error_message(response.status_code, response.text)
+                return self._build_error_result(error_msg, processing_time)
+        
+        except requests.exceptions.RequestException as e:
+            logger.warning("Google TTS request failed: %s", e)
+            return self._build_error_result(str(e))
+        except Exception as e:
+            # Public methods return error dicts, but unexpected failures still get a traceback
+            logger.exception("Unexpected Google TTS synthesis failure")
+            return self._build_error_result(str(e))
+    
+    async def asynthesize_speech(self, text: str, voice_id: str, language_code: str = 'en-US',
+                                 audio_format: str = 'mp3', speed: float = 1.0,
+                                 decode_audio: bool = True) -> Dict:
+        """Async variant of synthesize_speech built on a shared aiohttp session"""
+        if aiohttp is None:
+            return self._build_error_result('aiohttp is not installed; async synthesis is unavailable')
+        
+        if time.time() >= self._token_refresh_at:
+            await asyncio.to_thread(self._ensure_token_fresh)
+        if not self.access_token:
+            return self._build_auth_error_result()
+        
+        try:
+            validation = self.validate_parameters(text, voice_id, language_code, audio_format, speed)
+            if not validation['valid']:
+                return self._build_error_result('; '.join(validation['errors']))
+            
+            cache_key = audio_cache_key(text, voice_id, audio_format, speed, language_code)
+            cached_base64 = await asyncio.to_thread(self._audio_cache.get, cache_key, self._cache_format(audio_format))
+            if cached_base64 is not None:
+                return self._build_cached_result(text, voice_id, audio_format, speed, cached_base64, decode_audio)
+            
+            start_time = time.time()
             
+            body, headers = self._encode_request(self._build_payload(text, voice_id, language_code, audio_format, speed))
+            
+            session = self._get_aio_session()
+            # The slot caps in-flight requests per instance, shared with asynthesize_batch
+            async with self._request_slot(), session.post(
+                self._url_synthesize,
+                headers=headers,
+                params=self._auth_params,
+                data=body,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                body = await response.read()
+            processing_time = time.time() - start_time
+            
+            if response.status == 200:
+                audio_base64 = json_loads(body).get('audioContent', '')
+                await asyncio.to_thread(self._audio_cache.put, cache_key, self._cache_format(audio_format),
+                                        audio_base64.encode('ascii'))
+                audio_data = base64.b64decode(audio_base64) if decode_audio else None
+                return self._build_success_result(text, voice_id, audio_format, speed,
+                                                  audio_data, audio_base64, processing_time)
+            
+            error_msg = self._parse_error_message(response.status, body.decode('utf-8', 'replace'))
+            return self._build_error_result(error_msg, processing_time)
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Google TTS request failed: %s", e)
+            return self._build_error_result(str(e) or type(e).__name__)
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'audio_data': None,
-                'audio_size_bytes': 0,
-                'processing_time': 0.0
+            logger.exception("Unexpected Google TTS synthesis failure")
+            return self._build_error_result(str(e))
+    
+    def synthesize_batch(self, items: List[Dict]) -> List[Dict]:
+        """Synthesize several utterances concurrently
+        
+        Each item holds synthesize_speech keyword arguments (text, voice_id and
+        optionally language_code, audio_format, speed). The REST API has no
+        batch endpoint, so distinct items are sent in parallel, at most
+        provider.max_concurrency at a time, and duplicate items are
+        synthesized once. Results are returned in input order; a failed item
+        yields its own error response without failing the rest of the batch.
+        """
+        unique = {}
+        slots = []
+        for item in items:
+            key = (item.get('text'), item.get('voice_id'), item.get('language_code', 'en-US'),
+                   item.get('audio_format', 'mp3'), item.get('speed', 1.0))
+            slots.append(unique.setdefault(key, len(unique)))
+        if not unique:
+            return []
+        
+        max_workers = min(len(unique), self._max_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda args: self.synthesize_speech(*args), unique))
+        
+        # Duplicates get their own copy so callers can annotate results independently
+        seen = set()
+        batch = []
+        for slot in slots:
+            batch.append(dict(results[slot]) if slot in seen else results[slot])
+            seen.add(slot)
+        return batch
+    
+    async def asynthesize_batch(self, items: List[Dict]) -> List[Dict]:
+        """Async variant of synthesize_batch
+        
+        Requests are pipelined over the shared aiohttp session and share the
+        provider.max_concurrency gate of asynthesize_speech; results are in
+        input order.
+        """
+        async def synthesize_one(item: Dict) -> Dict:
+            return await self.asynthesize_speech(**item)
+        
+        results = await asyncio.gather(*(synthesize_one(item) for item in items), return_exceptions=True)
+        return [
+            self._build_error_result(str(result)) if isinstance(result, BaseException) else result
+            for result in results
+        ]
+    
+    def _get_aio_session(self):
+        """Lazily create the aiohttp session; must be called from a running event loop"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._aio_session
+    
+    async def aclose(self):
+        """Close the aiohttp session used by the async API"""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+    
+    def _build_payload(self, text: str, voice_id: str, language_code: str,
+                       audio_format: str, speed: float) -> bytes:
+        """Encode the synthesis request body; only the input text is new on every call
+        
+        The voice and audioConfig members are encoded once per combination and
+        spliced after the freshly encoded text, giving the same bytes as
+        encoding the whole payload.
+        """
+        key = (voice_id, language_code, audio_format, speed)
+        tail = self._payload_tail_cache.get(key)
+        if tail is None:
+            if len(self._payload_tail_cache) >= PARAMS_CACHE_SIZE:
+                self._payload_tail_cache.clear()
+            tail = self._payload_tail_cache[key] = b',' + json_dumps({
+                'voice': self._get_voice_params(voice_id, language_code),
+                'audioConfig': self._get_audio_config(audio_format, speed)
+            })[1:]
+        return b'{"input":{"text":' + json_dumps(text) + b'}' + tail
+    
+    def _encode_request(self, payload: bytes):
+        """Return the body and headers to send, gzip-compressing long payloads"""
+        if not self._compress_requests or len(payload) < GZIP_MIN_BODY_BYTES:
+            return payload, self._auth_headers
+        return gzip.compress(payload, compresslevel=1), {**self._auth_headers, 'Content-Encoding': 'gzip'}
+    
+    def _parse_error_message(self, status_code: int, body: str) -> str:
+        """Extract the API error message from an error response body"""
+        error_msg = f"HTTP {status_code}: {body}"
+        try:
+            error_data = json_loads(body)
+            if 'error' in error_data:
+                error_msg = error_data['error'].get('message', error_msg)
+        except (ValueError, AttributeError, TypeError):
+            # Non-JSON or unexpected error body; keep the raw HTTP message
+            pass
+        return error_msg
+    
+    def _build_auth_error_result(self) -> Dict:
+        """Build the error response for calls made without usable credentials"""
+        error_msg = 'Google TTS not authenticated. '
+        if not self.api_key:
+            error_msg += 'Please configure a Google Cloud API key or service account JSON key in the API Keys section.'
+        else:
+            error_msg += 'Please check your Google Cloud API credentials. Ensure the key has Text-to-Speech API permissions.'
+        return self._build_error_result(error_msg)
+    
+    def _build_error_result(self, error: str, processing_time: float = 0.0) -> Dict:
+        """Build the standard error response"""
+        return {
+            'success': False,
+            'error': error,
+            'audio_data': None,
+            'audio_size_bytes': 0,
+            'processing_time': processing_time
+        }
+    
+    def _get_voice_params(self, voice_id: str, language_code: str) -> Dict:
+        """Return the shared voice selection block for a voice; callers must not mutate it"""
+        key = (voice_id, language_code)
+        voice_params = self._voice_params_cache.get(key)
+        if voice_params is None:
+            if len(self._voice_params_cache) >= PARAMS_CACHE_SIZE:
+                self._voice_params_cache.clear()
+            voice_params = self._voice_params_cache[key] = {
+                'languageCode': language_code,
+                'name': voice_id
             }
+        return voice_params
     
-    def get_service_status(self) -> Dict:
-        """Check Google TTS service status using REST API"""
+    def _get_audio_config(self, audio_format: str, speed: float) -> Dict:
+        """Return the shared audio config block for a format and speed; callers must not mutate it"""
+        key = (audio_format, speed)
+        audio_config = self._audio_config_cache.get(key)
+        if audio_config is None:
+            if len(self._audio_config_cache) >= PARAMS_CACHE_SIZE:
+                self._audio_config_cache.clear()
+            audio_config = self._audio_config_cache[key] = {
+                'audioEncoding': self._AUDIO_ENCODINGS.get(audio_format, 'MP3'),
+                'speakingRate': speed
+            }
+        return audio_config
+    
+    @staticmethod
+    def _cache_format(audio_format: str) -> str:
+        """Cache file suffix; entries hold the base64 audioContent, not raw audio"""
+        return f"{audio_format}.b64"
+    
+    def _build_cached_result(self, text: str, voice_id: str, audio_format: str, speed: float,
+                             cached_base64: bytes, decode_audio: bool) -> Dict:
+        """Build the success response for a cache hit"""
+        audio_data = base64.b64decode(cached_base64) if decode_audio else None
+        return self._build_success_result(text, voice_id, audio_format, speed,
+                                          audio_data, cached_base64.decode('ascii'), 0.0)
+    
+    def _build_success_result(self, text: str, voice_id: str, audio_format: str, speed: float,
+                              audio_data: Optional[bytes], audio_base64: str, processing_time: float) -> Dict:
+        """Build the standard success response for synthesized audio"""
+        # Create data URL for immediate playback
+        audio_url = f"data:audio/{audio_format};base64,{audio_base64}"
+        
+        if audio_data is not None:
+            audio_size = len(audio_data)
+        else:
+            # Decoded size of the padded base64 payload, without decoding it
+            audio_size = len(audio_base64) * 3 // 4 - audio_base64[-2:].count('=')
+        
+        # Estimate audio duration from the character count, which also holds
+        # for scripts that are not space separated
+        estimated_duration = len(text) / SPEECH_CHARS_PER_SECOND / speed
+        
+        return {
+            'success': True,
+            'audio_data': audio_data,
+            'audio_url': audio_url,
+            'audio_size_bytes': audio_size,
+            'audio_duration': estimated_duration,
+            'processing_time': processing_time,
+            'voice_used': voice_id,
+            'format': audio_format,
+            'text_length': len(text),
+            'character_count': len(text),
+            'error': None
+        }
+    
+    def get_service_status(self, use_cache: bool = True) -> Dict:
+        """Check Google TTS service status using REST API
+        
+        Probe results, including failures, are reused for STATUS_CACHE_TTL
+        seconds so that health checks polling a broken endpoint do not retry
+        it on every call; pass use_cache=False to force a fresh probe.
+        """
+        now = time.monotonic()
+        if use_cache and self._status_cache is not None and now - self._status_ts < STATUS_CACHE_TTL:
+            return self._status_cache
+        
+        status = self._probe_service_status()
+        self._status_cache = status
+        self._status_ts = time.monotonic()
+        return status
+    
+    def _probe_service_status(self) -> Dict:
+        """Check the voices endpoint, reusing the cached catalog while it is fresh"""
+        self._ensure_token_fresh()
         if not self.access_token:
             return {
                 'service_available': False,
@@ -454,36 +810,22 @@ class GoogleTTS:
             }
         
         try:
-            # Test with a simple voices list call
-            headers = {
-                'Content-Type': 'application/json'
+            # Test with a voices list call, shared with get_available_voices
+            voices_data = self._fetch_voices_data()
+            return {
+                'service_available': True,
+                'status': 'Active',
+                'available_voices': len(voices_data.get('voices', [])),
+                'authenticated': True
+            }
+        
+        except requests.exceptions.HTTPError as e:
+            return {
+                'service_available': False,
+                'status': f'HTTP {e.response.status_code}',
+                'error': e.response.text,
+                'authenticated': bool(self.access_token)
             }
-            
-            # If access_token looks like an API key, use key parameter
-            if len(self.access_token) < 100:
-                url = f"{self.base_url}/voices?key={self.access_token}"
-            else:
-                url = f"{self.base_url}/voices"
-                headers['Authorization'] = f'Bearer {self.access_token}'
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                voices_data = response.json()
-                return {
-                    'service_available': True,
-                    'status': 'Active',
-                    'available_voices': len(voices_data.get('voices', [])),
-                    'authenticated': True
-                }
-            else:
-                return {
-                    'service_available': False,
-                    'status': f'HTTP {response.status_code}',
-                    'error': response.text,
-                    'authenticated': bool(self.access_token)
-                }
-            
         except Exception as e:
             return {
                 'service_available': False,
@@ -492,28 +834,31 @@ class GoogleTTS:
                 'authenticated': bool(self.access_token)
             }
     
-    def is_service_available(self) -> bool:
+    def is_service_available(self, use_cache: bool = True) -> bool:
         """Check if Google TTS service is available"""
-        try:
-            status = self.get_service_status()
-            return status.get('service_available', False)
-        except:
-            return False
+        # get_service_status reports failures in its result instead of raising
+        return self.get_service_status(use_cache).get('service_available', False)
     
     def validate_parameters(self, text: str, voice_id: str, language_code: str, 
                           audio_format: str, speed: float) -> Dict:
         """Validate synthesis parameters"""
+        # Fast path for the common case where everything is valid
+        if (text and voice_id and audio_format in VALID_AUDIO_FORMATS
+                and 0.25 <= speed <= 4.0 and len(text) <= MAX_TEXT_LENGTH
+                and not text.isspace()):
+            return _VALID_RESULT
+        
         errors = []
         
-        if not text or not text.strip():
+        if not text or text.isspace():
             errors.append("Text cannot be empty")
-        elif len(text) > 5000:
-            errors.append("Text too long (max 5000 characters)")
+        elif len(text) > MAX_TEXT_LENGTH:
+            errors.append(f"Text too long (max {MAX_TEXT_LENGTH} characters)")
         
         if not voice_id:
             errors.append("Voice ID is required")
         
-        if audio_format not in ['mp3', 'wav', 'ogg']:
+        if audio_format not in VALID_AUDIO_FORMATS:
             errors.append("Invalid audio format. Supported: mp3, wav, ogg")
         
         if speed < 0.25 or speed > 4.0:
@@ -1,294 +1,469 @@
-import requests
-import json
 import time
-import io
-from typing import List, Dict, Optional
-import sys
-import os
-# Add TTS base provider to path
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import base64
+import asyncio
+from types import MappingProxyType
+from typing import AsyncIterator, List, Dict, Optional
+
+from providers.TTS.base_tts_provider import BaseTTSProvider, RETRY_STATUSES, STREAM_CHUNK_SIZE
+from providers.core.audio_cache import audio_cache_key
+from providers.core.json_codec import json_dumps, json_loads
+
 try:
-    from base_tts_provider import BaseTTSProvider
+    import aiohttp
 except ImportError:
-    # Fallback for standalone usage
-    BaseTTSProvider = object
+    # Async API is optional; the sync API uses the pooled session from BaseTTSProvider
+    aiohttp = None
+
+# Voice IDs accepted by the /audio/speech endpoint
+VALID_VOICES = frozenset({'alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer', 'ash', 'ballad', 'coral', 'sage'})
+
+# Audio formats accepted by validate_parameters
+VALID_AUDIO_FORMATS = frozenset({'mp3', 'opus', 'aac', 'flac', 'wav', 'ogg'})
+
+# Requested format to OpenAI response_format; OpenAI uses opus for ogg-like output
+_FORMAT_MAPPING = MappingProxyType({
+    'mp3': 'mp3',
+    'wav': 'wav',
+    'ogg': 'opus'
+})
+
+# Static model catalog; dicts are shared between callers, lists are copied
+_MODELS = (
+    {
+        'id': 'tts-1',
+        'name': 'TTS-1 (Standard)',
+        'description': 'Standard text-to-speech model with good quality and speed',
+        'max_characters': 4096,
+        'supported_formats': ['mp3', 'opus', 'aac', 'flac'],
+        'cost_per_1k_chars': 0.015
+    },
+    {
+        'id': 'tts-1-hd',
+        'name': 'TTS-1-HD (High Definition)',
+        'description': 'High-definition text-to-speech model with superior quality',
+        'max_characters': 4096,
+        'supported_formats': ['mp3', 'opus', 'aac', 'flac'],
+        'cost_per_1k_chars': 0.030
+    }
+)
+
+# (id, name, description, gender) for each official OpenAI voice
+_VOICES = (
+    ('alloy', 'Alloy', 'Balanced and versatile voice', 'neutral'),
+    ('echo', 'Echo', 'Warm and friendly voice', 'male'),
+    ('fable', 'Fable', 'Expressive and storytelling voice', 'male'),
+    ('onyx', 'Onyx', 'Deep and authoritative voice', 'male'),
+    ('nova', 'Nova', 'Clear and professional voice', 'female'),
+    ('shimmer', 'Shimmer', 'Bright and energetic voice', 'female'),
+    ('ash', 'Ash', 'Warm and friendly voice (new)', 'male'),
+    ('ballad', 'Ballad', 'Melodic and expressive voice (new)', 'female'),
+    ('coral', 'Coral', 'Cheerful and positive voice (new)', 'female'),
+    ('sage', 'Sage', 'Wise and thoughtful voice (new)', 'neutral')
+)
+
+# Per-request headers for each response_format, built once; the session carries the auth headers
+_SPEECH_HEADERS = MappingProxyType({
+    response_format: MappingProxyType({'Accept': mime_type})
+    for response_format, mime_type in (
+        ('mp3', 'audio/mpeg'),
+        ('opus', 'audio/ogg'),
+        ('aac', 'audio/aac'),
+        ('flac', 'audio/flac'),
+        ('wav', 'audio/wav')
+    )
+})
 
-class OpenAITTS:
+# OpenAI accepts at most this many characters per request
+MAX_TEXT_LENGTH = 4096
+
+# Average speaking rate used to estimate audio duration (~150 words per minute)
+SPEECH_CHARS_PER_SECOND = 15.0
+
+# Extra attempts for a speech request answered with a RETRY_STATUSES code
+API_MAX_RETRIES = 3
+
+# Total seconds the blocking synthesize_speech may sleep between retries; it can run on
+# an event loop thread, so a longer Retry-After returns the error instead of waiting
+SYNC_RETRY_BUDGET = 2.0
+
+# Seconds a service status probe result is reused before probing again
+STATUS_CACHE_TTL = 30
+
+# Seconds a status probe may take before the service is reported unavailable
+STATUS_TIMEOUT = 3.0
+
+class OpenAITTS(BaseTTSProvider):
     """OpenAI Text-to-Speech provider"""
     
+    cache_name = 'openai'
+    
     def __init__(self, config: dict, api_key: str = None):
-        self.config = config
-        self.api_key = api_key
-        self.provider_name = config['provider']['name']
+        super().__init__(config, api_key)
         self.base_url = "https://api.openai.com/v1"
+        # Shared by every request; format-specific Accept headers come from _SPEECH_HEADERS
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        
+        self._url_speech = f"{self.base_url}/audio/speech"
+        self._url_models = f"{self.base_url}/models"
+        
+        # Keep-alive session shared by every instance using the same API key
+        self.session = self.session_for(self.base_url, self.headers)
+        self._aio_session = None
+        self._status_cache = None
+        self._status_ts = 0.0
+        self._voices = None
+        self._langs = None
+        self._lang_set = frozenset()
     
     def get_available_models(self) -> List[Dict]:
         """Get available TTS models from OpenAI"""
-        return [
-            {
-                'id': 'tts-1',
-                'name': 'TTS-1 (Standard)',
-                'description': 'Standard text-to-speech model with good quality and speed',
-                'max_characters': 4096,
-                'supported_formats': ['mp3', 'opus', 'aac', 'flac'],
-                'cost_per_1k_chars': 0.015
-            },
-            {
-                'id': 'tts-1-hd',
-                'name': 'TTS-1-HD (High Definition)',
-                'description': 'High-definition text-to-speech model with superior quality',
-                'max_characters': 4096,
-                'supported_formats': ['mp3', 'opus', 'aac', 'flac'],
-                'cost_per_1k_chars': 0.030
-            }
-        ]
+        return list(_MODELS)
     
     def get_available_voices(self, language_code: str = 'en-US') -> List[Dict]:
-        """Get available voices for OpenAI TTS"""
-        # Get comprehensive language support from config
-        comprehensive_languages = self._get_comprehensive_languages()
-        
-        # Define all available voices with comprehensive language support (updated with official OpenAI voices)
-        all_voices = [
-            {
-                'id': 'alloy',
-                'name': 'Alloy',
-                'description': 'Balanced and versatile voice',
-                'gender': 'neutral',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'echo',
-                'name': 'Echo',
-                'description': 'Warm and friendly voice',
-                'gender': 'male',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'fable',
-                'name': 'Fable',
-                'description': 'Expressive and storytelling voice',
-                'gender': 'male',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'onyx',
-                'name': 'Onyx',
-                'description': 'Deep and authoritative voice',
-                'gender': 'male',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'nova',
-                'name': 'Nova',
-                'description': 'Clear and professional voice',
-                'gender': 'female',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'shimmer',
-                'name': 'Shimmer',
-                'description': 'Bright and energetic voice',
-                'gender': 'female',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'ash',
-                'name': 'Ash',
-                'description': 'Warm and friendly voice (new)',
-                'gender': 'male',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'ballad',
-                'name': 'Ballad',
-                'description': 'Melodic and expressive voice (new)',
-                'gender': 'female',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'coral',
-                'name': 'Coral',
-                'description': 'Cheerful and positive voice (new)',
-                'gender': 'female',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            },
-            {
-                'id': 'sage',
-                'name': 'Sage',
-                'description': 'Wise and thoughtful voice (new)',
-                'gender': 'neutral',
-                'language_codes': comprehensive_languages,
-                'supported_languages': comprehensive_languages
-            }
-        ]
+        """Get available voices for OpenAI TTS
         
-        # Filter voices that support the requested language
-        filtered_voices = []
-        if language_code in comprehensive_languages:
-            filtered_voices = all_voices
+        Every voice supports every configured language, so the voice list is
+        built once per instance and shared by all matching lookups.
+        """
+        if self._voices is None:
+            comprehensive_languages = self._get_comprehensive_languages()
+            self._voices = [
+                {
+                    'id': voice_id,
+                    'name': name,
+                    'description': description,
+                    'gender': gender,
+                    'language_codes': comprehensive_languages,
+                    'supported_languages': comprehensive_languages
+                }
+                for voice_id, name, description, gender in _VOICES
+            ]
         
-        return filtered_voices
-
+        # Filter voices that support the requested language
+        if language_code in self._lang_set:
+            return list(self._voices)
+        return []
+    
     def _get_comprehensive_languages(self) -> List[str]:
-        """Get comprehensive language support from config"""
+        """Get comprehensive language support from config, resolved once per instance"""
+        if self._langs is not None:
+            return self._langs
+        
+        # Fallback to basic languages if config loading fails
+        langs = ["en-US", "en-GB"]
         try:
             # Always read from config to follow DRY principle
             if hasattr(self, 'config') and 'supported_languages' in self.config:
-                return self.config['supported_languages']
-        except:
+                langs = self.config['supported_languages']
+        except TypeError:
             pass
         
-        # Fallback to basic languages if config loading fails
-        return ["en-US", "en-GB"]
+        self._langs = langs
+        self._lang_set = frozenset(langs)
+        return langs
     
-    def generate_speech(self, text: str, voice_id: str, model_id: str = 'tts-1', 
+    def generate_speech(self, text: str, voice_id: str, model_id: str = 'tts-1',
                        language_code: str = 'en-US', audio_format: str = 'mp3', speed: float = 1.0) -> Dict:
         """Generate speech using OpenAI TTS API - main method called by backend"""
-        return self.synthesize_speech(text, voice_id, language_code, audio_format, speed)
+        return self.synthesize_speech(text, voice_id, language_code, audio_format, speed,
+                                      return_data_url=True)
     
     def synthesize_speech(self, text: str, voice_id: str, language_code: str = 'en-US',
-                         audio_format: str = 'mp3', speed: float = 1.0) -> Dict:
-        """Synthesize speech using OpenAI TTS API"""
+                         audio_format: str = 'mp3', speed: float = 1.0,
+                         return_data_url: bool = False) -> Dict:
+        """Synthesize speech using OpenAI TTS API
+        
+        Results are cached on disk by a hash of the synthesis inputs, so a
+        repeated request is served without calling the API.
+        The base64 data URL in audio_url is only built when return_data_url
+        is set; callers that read audio_data or use stream_speech skip the copy.
+        """
         try:
             # Validate parameters
             validation = self.validate_parameters(text, voice_id, language_code, audio_format, speed)
             if not validation['valid']:
-                return {
-                    'success': False,
-                    'error': '; '.join(validation['errors']),
-                    'audio_data': None,
-                    'audio_size_bytes': 0,
-                    'processing_time': 0.0
-                }
+                return self._build_error_result('; '.join(validation['errors']))
             
             # Use tts-1 as default model, can be made configurable
             model = 'tts-1'
+            response_format = _FORMAT_MAPPING.get(audio_format, 'mp3')
             
-            # Map format names
-            format_mapping = {
-                'mp3': 'mp3',
-                'wav': 'wav',
-                'ogg': 'opus'  # OpenAI uses opus for ogg-like format
-            }
-            
-            response_format = format_mapping.get(audio_format, 'mp3')
+            # Identical inputs produce identical audio, so serve repeats from disk
+            cache_key = audio_cache_key(text, voice_id, response_format, speed, model)
+            cached_audio = self._audio_cache.get(cache_key, response_format)
+            if cached_audio is not None:
+                return self._build_success_result(text, voice_id, model, response_format, speed,
+                                                  cached_audio, 0.0, return_data_url)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
+            request_body = self._build_payload(model, text, voice_id, response_format, speed)
             
-            # Prepare request payload
-            payload = {
-                'model': model,
-                'input': text,
-                'voice': voice_id,
-                'response_format': response_format,
-                'speed': speed
-            }
-            
-            # Make API request
-            response = requests.post(
-                f"{self.base_url}/audio/speech",
-                headers=self.headers,
-                json=payload,
-                stream=True
-            )
-            
-            end_time = time.time()
-            processing_time = end_time - start_time
+            # Make API request on the pooled connection, briefly backing off on 429/5xx
+            retry_wait = 0.0
+            for attempt in range(API_MAX_RETRIES + 1):
+                response = self.session.post(self._url_speech, data=request_body, stream=True,
+                                             headers=_SPEECH_HEADERS[response_format])
+                self._note_rate_limit(response.status_code, response.headers)
+                if response.status_code not in RETRY_STATUSES or attempt == API_MAX_RETRIES:
+                    break
+                delay = self._retry_delay(attempt, response.headers)
+                if retry_wait + delay > SYNC_RETRY_BUDGET:
+                    break
+                response.close()
+                time.sleep(delay)
+                retry_wait += delay
             
             if response.status_code == 200:
-                audio_data = response.content
-                audio_size = len(audio_data)
-                
-                # Save audio to a temporary file and create URL
-                import tempfile
-                import base64
-                
-                # Create data URL for immediate playback (for small files)
-                audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-                audio_url = f"data:audio/{response_format};base64,{audio_base64}"
-                
-                # Estimate audio duration (rough calculation)
-                # Average speaking rate is ~150 words per minute
-                words = len(text.split())
-                estimated_duration = (words / 150) * 60 / speed
+                # Write each chunk to the cache file as it arrives
+                audio_buffer = bytearray()
+                with self._audio_cache.writer(cache_key, response_format) as cache_file:
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        audio_buffer.extend(chunk)
+                        cache_file.write(chunk)
+                audio_data = bytes(audio_buffer)
                 
-                return {
-                    'success': True,
-                    'audio_data': audio_data,
-                    'audio_url': audio_url,
-                    'audio_size_bytes': audio_size,
-                    'audio_duration': estimated_duration,
-                    'processing_time': processing_time,
-                    'model_used': model,
-                    'voice_used': voice_id,
-                    'format': response_format,
-                    'text_length': len(text),
-                    'character_count': len(text),
-                    'error': None
-                }
+                processing_time = time.perf_counter() - start_time
+                return self._build_success_result(text, voice_id, model, response_format, speed,
+                                                  audio_data, processing_time, return_data_url)
             else:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                try:
-                    error_data = response.json()
-                    if 'error' in error_data:
-                        error_msg = error_data['error'].get('message', error_msg)
-                except:
-                    pass
-                
-                return {
-                    'success': False,
-                    'error': error_msg,
-                    'audio_data': None,
-                    'audio_size_bytes': 0,
-                    'processing_time': processing_time
-                }
+                processing_time = time.perf_counter() - start_time
+                error_msg = self._parse_error_message(response.status_code, response.text)
+                return self._build_error_result(error_msg, processing_time)
         
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'audio_data': None,
-                'audio_size_bytes': 0,
-                'processing_time': 0.0
-            }
+            return self._build_error_result(str(e))
     
-    def get_service_status(self) -> Dict:
-        """Check OpenAI TTS service status"""
+    async def asynthesize_speech(self, text: str, voice_id: str, language_code: str = 'en-US',
+                                 audio_format: str = 'mp3', speed: float = 1.0,
+                                 return_data_url: bool = False) -> Dict:
+        """Async variant of synthesize_speech built on a shared aiohttp session
+        
+        At most provider.max_concurrency requests per instance are in flight;
+        429s and exhausted x-ratelimit budgets pause further requests.
+        """
+        if aiohttp is None:
+            return self._build_error_result('aiohttp is not installed; async synthesis is unavailable')
+        
         try:
-            # Test with a simple request to models endpoint
-            response = requests.get(
-                f"{self.base_url}/models",
+            validation = self.validate_parameters(text, voice_id, language_code, audio_format, speed)
+            if not validation['valid']:
+                return self._build_error_result('; '.join(validation['errors']))
+            
+            model = 'tts-1'
+            response_format = _FORMAT_MAPPING.get(audio_format, 'mp3')
+            
+            cache_key = audio_cache_key(text, voice_id, response_format, speed, model)
+            cached_audio = await asyncio.to_thread(self._audio_cache.get, cache_key, response_format)
+            if cached_audio is not None:
+                return self._build_success_result(text, voice_id, model, response_format, speed,
+                                                  cached_audio, 0.0, return_data_url)
+            
+            start_time = time.perf_counter()
+            request_body = self._build_payload(model, text, voice_id, response_format, speed)
+            session = self._get_aio_session()
+            
+            for attempt in range(API_MAX_RETRIES + 1):
+                async with self._request_slot():
+                    async with session.post(
+                        self._url_speech,
+                        data=request_body,
+                        headers=_SPEECH_HEADERS[response_format],
+                        timeout=aiohttp.ClientTimeout(total=30, connect=5)
+                    ) as response:
+                        body = await response.read()
+                    self._note_rate_limit(response.status, response.headers)
+                if response.status not in RETRY_STATUSES or attempt == API_MAX_RETRIES:
+                    break
+                # Back off outside the slot so other requests can proceed meanwhile
+                await asyncio.sleep(self._retry_delay(attempt, response.headers))
+            processing_time = time.perf_counter() - start_time
+            
+            if response.status == 200:
+                await asyncio.to_thread(self._audio_cache.put, cache_key, response_format, body)
+                return self._build_success_result(text, voice_id, model, response_format, speed,
+                                                  body, processing_time, return_data_url)
+            
+            error_msg = self._parse_error_message(response.status, body.decode('utf-8', 'replace'))
+            return self._build_error_result(error_msg, processing_time)
+        
+        except Exception as e:
+            return self._build_error_result(str(e) or type(e).__name__)
+    
+    async def asynthesize_batch(self, items: List[Dict]) -> List[Dict]:
+        """Synthesize several utterances concurrently over the shared aiohttp session
+        
+        Each item holds asynthesize_speech keyword arguments. Requests share
+        the provider.max_concurrency gate of asynthesize_speech; results are
+        returned in input order and a failed item yields its own error
+        response without failing the rest of the batch.
+        """
+        async def synthesize_one(item: Dict) -> Dict:
+            # Bad keyword arguments raise here, inside the task, not while gathering
+            return await self.asynthesize_speech(**item)
+        
+        results = await asyncio.gather(*(synthesize_one(item) for item in items), return_exceptions=True)
+        return [
+            self._build_error_result(str(result) or type(result).__name__)
+            if isinstance(result, BaseException) else result
+            for result in results
+        ]
+    
+    async def stream_speech(self, text: str, voice_id: str, language_code: str = 'en-US',
+                            audio_format: str = 'mp3', speed: float = 1.0) -> AsyncIterator[bytes]:
+        """Yield audio chunks as OpenAI sends them, so playback can start before synthesis ends
+        
+        Invalid parameters raise ValueError and API failures raise RuntimeError,
+        both before the first chunk is yielded. Cached audio is yielded in one
+        chunk; a fully streamed clip is added to the cache.
+        """
+        if aiohttp is None:
+            async for chunk in super().stream_speech(text, voice_id, language_code, audio_format, speed):
+                yield chunk
+            return
+        
+        validation = self.validate_parameters(text, voice_id, language_code, audio_format, speed)
+        if not validation['valid']:
+            raise ValueError('; '.join(validation['errors']))
+        
+        model = 'tts-1'
+        response_format = _FORMAT_MAPPING.get(audio_format, 'mp3')
+        
+        cache_key = audio_cache_key(text, voice_id, response_format, speed, model)
+        cached_audio = await asyncio.to_thread(self._audio_cache.get, cache_key, response_format)
+        if cached_audio is not None:
+            yield cached_audio
+            return
+        
+        audio_buffer = bytearray()
+        request_body = self._build_payload(model, text, voice_id, response_format, speed)
+        session = self._get_aio_session()
+        
+        # Failed attempts are retried only before any audio has been yielded
+        for attempt in range(API_MAX_RETRIES + 1):
+            async with self._request_slot():
+                # No total timeout: long clips keep streaming as long as chunks keep arriving
+                async with session.post(
+                    self._url_speech,
+                    data=request_body,
+                    headers=_SPEECH_HEADERS[response_format],
+                    timeout=aiohttp.ClientTimeout(total=None, connect=5, sock_read=30)
+                ) as response:
+                    self._note_rate_limit(response.status, response.headers)
+                    if response.status == 200:
+                        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                            audio_buffer.extend(chunk)
+                            yield chunk
+                        break
+                    body = await response.text()
+            
+            if response.status not in RETRY_STATUSES or attempt == API_MAX_RETRIES:
+                raise RuntimeError(self._parse_error_message(response.status, body))
+            await asyncio.sleep(self._retry_delay(attempt, response.headers))
+        
+        # Only reached when the consumer read the whole clip
+        await asyncio.to_thread(self._audio_cache.put, cache_key, response_format, bytes(audio_buffer))
+    
+    def _get_aio_session(self):
+        """Lazily create the aiohttp session; must be called from a running event loop"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
                 headers=self.headers,
-                timeout=10
+                connector=aiohttp.TCPConnector(limit=256, limit_per_host=self._max_concurrency, ttl_dns_cache=300)
             )
-            
-            if response.status_code == 200:
-                return {
-                    'service_available': True,
-                    'status': 'Active',
-                    'api_key_valid': True
-                }
-            else:
-                return {
-                    'service_available': False,
-                    'status': f'HTTP {response.status_code}',
-                    'api_key_valid': response.status_code != 401,
-                    'error': response.text
-                }
+        return self._aio_session
+    
+    async def aclose(self):
+        """Close the aiohttp session used by the async API"""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+    
+    def _build_payload(self, model: str, text: str, voice_id: str, response_format: str, speed: float) -> bytes:
+        """Encode the /audio/speech request body; retries resend the same bytes"""
+        return json_dumps({
+            'model': model,
+            'input': text,
+            'voice': voice_id,
+            'response_format': response_format,
+            'speed': speed
+        })
+    
+    def _build_success_result(self, text: str, voice_id: str, model: str, response_format: str,
+                              speed: float, audio_data: bytes, processing_time: float,
+                              return_data_url: bool) -> Dict:
+        """Build the standard success response for synthesized audio"""
+        # Create data URL for immediate playback (for compatibility with frontend)
+        audio_url = self._build_data_url(audio_data, response_format) if return_data_url else None
+        
+        # Estimate audio duration from the character count, which also holds
+        # for scripts that are not space separated
+        estimated_duration = len(text) / SPEECH_CHARS_PER_SECOND / speed
+        
+        return {
+            'success': True,
+            'audio_data': audio_data,
+            'audio_url': audio_url,
+            'audio_size_bytes': len(audio_data),
+            'audio_duration': estimated_duration,
+            'processing_time': processing_time,
+            'model_used': model,
+            'voice_used': voice_id,
+            'format': response_format,
+            'text_length': len(text),
+            'character_count': len(text),
+            'error': None
+        }
+    
+    def _build_data_url(self, audio_data: bytes, audio_format: str) -> str:
+        """Encode audio bytes as a data URL for direct playback in the browser"""
+        audio_base64 = base64.b64encode(memoryview(audio_data)).decode('ascii')
+        return f"data:audio/{audio_format};base64,{audio_base64}"
+    
+    def _build_error_result(self, error: str, processing_time: float = 0.0) -> Dict:
+        """Build the standard failure response"""
+        return {
+            'success': False,
+            'error': error,
+            'audio_data': None,
+            'audio_size_bytes': 0,
+            'processing_time': processing_time
+        }
+    
+    def _parse_error_message(self, status_code: int, body: str) -> str:
+        """Extract the API error message from a failed response body"""
+        error_msg = f"HTTP {status_code}: {body}"
+        try:
+            error_data = json_loads(body)
+            if 'error' in error_data:
+                error_msg = error_data['error'].get('message', error_msg)
+        except (ValueError, AttributeError, TypeError):
+            pass
+        return error_msg
+    
+    def get_service_status(self, use_cache: bool = True) -> Dict:
+        """Check OpenAI TTS service status
+        
+        Probe results, including failures, are reused for STATUS_CACHE_TTL
+        seconds so that UIs polling the status do not add a round trip per
+        poll; pass use_cache=False to force a fresh probe.
+        """
+        cached = self._cached_status(use_cache)
+        if cached is not None:
+            return cached
+        return self._store_status(self._probe_service_status())
+    
+    def _probe_service_status(self) -> Dict:
+        """Query the models endpoint"""
+        try:
+            # Test with a simple request to models endpoint
+            response = self.session.get(
+                self._url_models,
+                timeout=STATUS_TIMEOUT
+            )
+            return self._build_status_result(response.status_code, response.text)
         
         except Exception as e:
             return {
@@ -298,30 +473,81 @@ class OpenAITTS:
                 'error': str(e)
             }
     
-    def is_service_available(self) -> bool:
-        """Check if OpenAI TTS service is available"""
+    async def aget_service_status(self, use_cache: bool = True) -> Dict:
+        """Async variant of get_service_status, sharing its cache"""
+        if aiohttp is None:
+            return await asyncio.to_thread(self.get_service_status, use_cache)
+        
+        cached = self._cached_status(use_cache)
+        if cached is not None:
+            return cached
+        
         try:
-            status = self.get_service_status()
-            return status.get('service_available', False)
-        except:
-            return False
+            session = self._get_aio_session()
+            async with session.get(
+                self._url_models,
+                timeout=aiohttp.ClientTimeout(total=STATUS_TIMEOUT)
+            ) as response:
+                body = await response.text()
+            status = self._build_status_result(response.status, body)
+        
+        except Exception as e:
+            status = {
+                'service_available': False,
+                'status': 'Error',
+                'api_key_valid': None,
+                'error': str(e) or type(e).__name__
+            }
+        return self._store_status(status)
+    
+    def _cached_status(self, use_cache: bool) -> Optional[Dict]:
+        """Return the last probe result while it is fresh"""
+        if use_cache and self._status_cache is not None and time.monotonic() - self._status_ts < STATUS_CACHE_TTL:
+            return self._status_cache
+        return None
+    
+    def _store_status(self, status: Dict) -> Dict:
+        """Remember a probe result for STATUS_CACHE_TTL seconds"""
+        self._status_cache = status
+        self._status_ts = time.monotonic()
+        return status
+    
+    def _build_status_result(self, status_code: int, body: str) -> Dict:
+        """Turn a /models probe response into a service status"""
+        if status_code == 200:
+            return {
+                'service_available': True,
+                'status': 'Active',
+                'api_key_valid': True
+            }
+        return {
+            'service_available': False,
+            'status': f'HTTP {status_code}',
+            'api_key_valid': status_code != 401,
+            'error': body
+        }
+    
+    def is_service_available(self, use_cache: bool = True) -> bool:
+        """Check if OpenAI TTS service is available"""
+        # get_service_status reports failures in its result instead of raising
+        return self.get_service_status(use_cache).get('service_available', False)
     
     def validate_parameters(self, text: str, voice_id: str, language_code: str, 
                           audio_format: str, speed: float) -> Dict:
         """Validate synthesis parameters"""
         errors = []
         
-        if not text or not text.strip():
+        if not text or text.isspace():
             errors.append("Text cannot be empty")
-        elif len(text) > 4096:
-            errors.append("Text too long (max 4096 characters)")
+        elif len(text) > MAX_TEXT_LENGTH:
+            errors.append(f"Text too long (max {MAX_TEXT_LENGTH} characters)")
         
         if not voice_id:
             errors.append("Voice ID is required")
-        elif voice_id not in ['alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer', 'ash', 'ballad', 'coral', 'sage']:
+        elif voice_id not in VALID_VOICES:
             errors.append("Invalid voice ID. Supported: alloy, echo, fable, onyx, nova, shimmer, ash, ballad, coral, sage")
         
-        if audio_format not in ['mp3', 'opus', 'aac', 'flac', 'wav', 'ogg']:
+        if audio_format not in VALID_AUDIO_FORMATS:
             errors.append("Invalid audio format. Supported: mp3, opus, aac, flac, wav, ogg")
         
         if speed < 0.25 or speed > 4.0:
@@ -1,13 +1,116 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Union
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Optional, Union
+import asyncio
+import random
+import re
 import time
 import io
 
+import requests
+
+from providers.core.audio_cache import AudioCache
+from providers.core.http_session_pool import get_shared_session
+
+# Bytes per chunk yielded by stream_speech
+STREAM_CHUNK_SIZE = 16384
+
+# Async requests in flight per provider instance unless the config sets provider.max_concurrency
+DEFAULT_MAX_CONCURRENCY = 64
+
+# Pause applied when a rate-limited response carries no usable reset hint
+DEFAULT_RATE_LIMIT_PAUSE = 1.0
+
+# Upper bound on a rate-limit pause so a bogus header cannot stall every caller
+MAX_RATE_LIMIT_PAUSE = 60.0
+
+# Responses worth retrying: rate limits and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Exponential backoff between retries: RETRY_BACKOFF_BASE * 2**attempt seconds,
+# capped at RETRY_BACKOFF_CAP and jittered by +/-50% so clients do not retry in lockstep
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 8.0
+
+# Reset durations such as "20ms", "1.5s" or "6m0s" (OpenAI x-ratelimit-reset-* headers)
+_RESET_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_RESET_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+def _parse_reset_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After or x-ratelimit-reset-* header value into seconds"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _RESET_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _RESET_UNITS[unit] for amount, unit in parts)
+
 class BaseTTSProvider(ABC):
+    # Directory under the audio cache root for this provider; None disables the disk cache
+    cache_name: Optional[str] = None
+    
     def __init__(self, config: dict, api_key: str = None):
         self.config = config
         self.api_key = api_key
         self.provider_name = config['provider']['name']
+        self._audio_cache = AudioCache.for_provider(config, self.cache_name) if self.cache_name else AudioCache(None)
+        self._max_concurrency = config['provider'].get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._rate_limited_until = 0.0
+    
+    def session_for(self, base_url: str, headers: Optional[Dict[str, str]] = None, **pool_options) -> requests.Session:
+        """Return the process-wide keep-alive session for a base URL and this provider's API key
+        
+        Every provider instance sharing a host and key reuses one connection
+        pool; pool_options are passed to get_shared_session.
+        """
+        return get_shared_session(base_url, self.api_key, headers, **pool_options)
+    
+    @asynccontextmanager
+    async def _request_slot(self):
+        """Hold one of provider.max_concurrency async request slots for an outbound call
+        
+        Waits out any pause recorded by _note_rate_limit before the request
+        is sent, sleeping on the event loop rather than blocking it.
+        """
+        async with self._get_semaphore():
+            delay = self._rate_limited_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    def _retry_delay(self, attempt: int, headers) -> float:
+        """Seconds to wait before retry number attempt + 1 of a failed request
+        
+        Uses jittered exponential backoff, stretched to honour a Retry-After
+        header when the server sends a longer one.
+        """
+        delay = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+        retry_after = _parse_reset_seconds(headers.get('retry-after'))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, MAX_RATE_LIMIT_PAUSE))
+        return delay
+    
+    def _note_rate_limit(self, status_code: int, headers) -> None:
+        """Pause new async requests when a response says the request budget is spent"""
+        if status_code != 429 and headers.get('x-ratelimit-remaining-requests') != '0':
+            return
+        delay = _parse_reset_seconds(headers.get('retry-after') or headers.get('x-ratelimit-reset-requests'))
+        delay = min(delay if delay is not None else DEFAULT_RATE_LIMIT_PAUSE, MAX_RATE_LIMIT_PAUSE)
+        self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + delay)
     
     @abstractmethod
     def get_available_models(self) -> List[Dict]:
@@ -31,20 +134,31 @@ class BaseTTSProvider(ABC):
             language_code: Language code (e.g., 'en-US')
             audio_format: Output format ('mp3', 'wav', 'ogg')
             speed: Speech speed multiplier (0.5 - 2.0)
-            
+        
         Returns:
             Dict containing success status, audio data, and metadata
         """
         pass
     
+    async def stream_speech(self, text: str, voice_id: str, language_code: str = 'en-US',
+                            audio_format: str = 'mp3', speed: float = 1.0) -> AsyncIterator[bytes]:
+        """Yield synthesized audio as it becomes available
+        
+        Providers without a streaming API synthesize the whole clip in a worker
+        thread and yield it once. Failures raise RuntimeError carrying the
+        provider's error message, before any audio is yielded.
+        """
+        result = await asyncio.to_thread(self.synthesize_speech, text, voice_id, language_code, audio_format, speed)
+        if not result.get('success'):
+            raise RuntimeError(result.get('error') or 'Speech synthesis failed')
+        yield result['audio_data']
+    
     def test_speed(self, text: str, voice_id: str, language_code: str = 'en-US', 
                    audio_format: str = 'mp3', speed: float = 1.0) -> Dict:
         """Test synthesis speed and performance"""
-        total_start_time = time.time()
+        total_start_time = time.perf_counter()
         result = self.synthesize_speech(text, voice_id, language_code, audio_format, speed)
-        total_end_time = time.time()
-        
-        total_processing_time = total_end_time - total_start_time
+        total_processing_time = time.perf_counter() - total_start_time
         api_processing_time = result.get('processing_time', 0.0)
         overhead_time = total_processing_time - api_processing_time
         
@@ -74,10 +188,9 @@ class BaseTTSProvider(ABC):
         """Validate TTS parameters"""
         errors = []
         
-        if not text or not text.strip():
+        if not text or text.isspace():
             errors.append("Text cannot be empty")
-        
-        if len(text) > 5000:  # Most TTS services have character limits
+        elif len(text) > 5000:  # Most TTS services have character limits
             errors.append("Text exceeds maximum length of 5000 characters")
         
         if not voice_id:
@@ -5,12 +5,16 @@ Core provider framework - Core classes and utilities for provider management
 from .universal_provider_factory import UniversalProviderFactory, provider_factory
 from .provider_manager import ProviderManager
 from .base_provider import BaseASRProvider
-from .modular_manager import ModularProviderManager
+from .modular_manager import ModularProviderManager, ModelRecord
+from .results import TTSResult, TranscriptionResult
 
 __all__ = [
     'UniversalProviderFactory',
     'provider_factory', 
     'ProviderManager',
     'BaseASRProvider',
-    'ModularProviderManager'
+    'ModularProviderManager',
+    'ModelRecord',
+    'TTSResult',
+    'TranscriptionResult'
 ]
\ No newline at end of file
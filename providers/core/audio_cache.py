@@ -0,0 +1,186 @@
+"""
+On-disk cache of synthesized audio - one file per SHA-256 of the synthesis inputs,
+bounded in entries and bytes with least-recently-used eviction
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Used when the provider config has no cache_dir entry; a null cache_dir disables caching
+DEFAULT_CACHE_DIR = '~/.cache/kusha/tts'
+
+# Per-provider limits when the config has no cache_max_entries / cache_max_bytes
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def audio_cache_key(text: str, voice_id: str, audio_format: str, speed: float, model_id: str = '') -> str:
+    """Hash the inputs that determine the synthesized audio"""
+    raw = f"{model_id}|{voice_id}|{audio_format}|{speed:.3f}|{text.strip()}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+class AudioCache:
+    """Stores synthesized audio blobs keyed by audio_cache_key
+    
+    After each write the directory is trimmed to max_entries files and
+    max_bytes in total, dropping the least recently used entries first;
+    a cache hit refreshes the entry's mtime.
+    """
+    
+    def __init__(self, directory: Optional[str], max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = Path(directory).expanduser() if directory else None
+        if self.directory is not None:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning("Audio cache disabled, cannot create %s: %s", self.directory, e)
+                self.directory = None
+    
+    @classmethod
+    def for_provider(cls, config: dict, provider_dir: str) -> 'AudioCache':
+        """Build the cache for a provider from its config's cache_dir and size limits"""
+        base_dir = config.get('cache_dir', DEFAULT_CACHE_DIR)
+        return cls(os.path.join(os.path.expanduser(base_dir), provider_dir) if base_dir else None,
+                   config.get('cache_max_entries', DEFAULT_MAX_ENTRIES),
+                   config.get('cache_max_bytes', DEFAULT_MAX_BYTES))
+    
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+    
+    def path_for(self, key: str, audio_format: str) -> Path:
+        return self.directory / f"{key}.{audio_format}"
+    
+    def get(self, key: str, audio_format: str) -> Optional[bytes]:
+        """Return the cached audio, or None on a miss"""
+        if self.directory is None:
+            return None
+        path = self.path_for(key, audio_format)
+        try:
+            audio_data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            # Mark the entry as recently used so eviction spares it
+            os.utime(path)
+        except OSError:
+            pass
+        return audio_data
+    
+    def put(self, key: str, audio_format: str, audio_data: bytes):
+        """Store audio atomically so concurrent readers never see a partial file"""
+        with self.writer(key, audio_format) as cache_file:
+            cache_file.write(audio_data)
+    
+    @contextmanager
+    def writer(self, key: str, audio_format: str):
+        """Yield a file to stream audio into; it is published only if the block completes
+        
+        Cache write failures are logged and never propagate to the caller.
+        """
+        if self.directory is None:
+            yield _NullWriter()
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError as e:
+            logger.warning("Failed to write audio cache entry %s: %s", key, e)
+            yield _NullWriter()
+            return
+        
+        tmp_file = _SafeWriter(os.fdopen(fd, 'wb'))
+        try:
+            yield tmp_file
+        except BaseException:
+            # The caller failed mid-stream; drop the partial entry and re-raise
+            tmp_file.close()
+            _discard(tmp_path)
+            raise
+        
+        tmp_file.close()
+        error = tmp_file.failed
+        if error is None:
+            try:
+                os.replace(tmp_path, self.path_for(key, audio_format))
+            except OSError as e:
+                error = e
+            else:
+                self._prune()
+                return
+        logger.warning("Failed to write audio cache entry %s: %s", key, error)
+        _discard(tmp_path)
+    
+    def _prune(self):
+        """Evict least recently used entries until the cache is within its limits"""
+        entries = []
+        total_bytes = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    # Skip in-flight writes; they are published or discarded by their writer
+                    if entry.name.endswith('.tmp') or not entry.is_file():
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue  # Evicted by a concurrent writer
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                    total_bytes += st.st_size
+        except OSError as e:
+            logger.warning("Failed to scan audio cache %s: %s", self.directory, e)
+            return
+        
+        excess = len(entries) - self.max_entries
+        if excess <= 0 and total_bytes <= self.max_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            if excess <= 0 and total_bytes <= self.max_bytes:
+                break
+            _discard(path)
+            excess -= 1
+            total_bytes -= size
+
+def _discard(path: str):
+    """Remove a temporary cache file, ignoring errors"""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+class _NullWriter:
+    """Stand-in writer used when caching is disabled"""
+    
+    def write(self, data: bytes):
+        pass
+
+class _SafeWriter:
+    """Wraps a cache file so a failed write disables the entry instead of raising"""
+    
+    def __init__(self, file):
+        self._file = file
+        self.failed = None
+    
+    def write(self, data: bytes):
+        if self.failed is None:
+            try:
+                self._file.write(data)
+            except OSError as e:
+                self.failed = e
+    
+    def close(self):
+        try:
+            self._file.close()
+        except OSError as e:
+            if self.failed is None:
+                self.failed = e
@@ -0,0 +1,69 @@
+"""
+On-disk cache of parsed JSON config files - pickled, keyed by the source file's mtime and size
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .json_codec import json_loads
+
+logger = logging.getLogger(__name__)
+
+# Where parsed configs are cached; entries are named by a hash of the source path
+CONFIG_CACHE_DIR = '~/.cache/kusha/config'
+
+# Each entry starts with the source file's st_mtime_ns and st_size
+_HEADER = struct.Struct('<QQ')
+
+def load_json_cached(path) -> Any:
+    """Parse a JSON file, reusing the cached parse while the file is unchanged
+    
+    Cache failures are logged and fall back to parsing the file directly.
+    """
+    path = Path(path)
+    st = path.stat()
+    header = _HEADER.pack(st.st_mtime_ns, st.st_size)
+    cache_path = _cache_path_for(path)
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            if f.read(_HEADER.size) == header:
+                return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring unreadable config cache entry %s: %s", cache_path, e)
+    
+    # orjson parses UTF-8 bytes directly, so skip the text decode
+    data = json_loads(path.read_bytes())
+    _store(cache_path, header, data)
+    return data
+
+def _cache_path_for(path: Path) -> Path:
+    """Name the cache entry after the absolute path of the source file"""
+    digest = hashlib.sha256(str(path.resolve()).encode('utf-8')).hexdigest()
+    return Path(CONFIG_CACHE_DIR).expanduser() / f"{digest}.pkl"
+
+def _store(cache_path: Path, header: bytes, data: Any):
+    """Write a cache entry atomically so concurrent readers never see a partial file"""
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Failed to write config cache entry %s: %s", cache_path, e)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
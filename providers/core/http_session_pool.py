@@ -0,0 +1,49 @@
+"""
+Shared HTTP session pool - keep-alive sessions reused across provider instances
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry idempotent requests on transient gateway errors
+DEFAULT_RETRY = Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+
+_SESSIONS: Dict[Tuple[str, Optional[str]], requests.Session] = {}
+_LOCK = threading.Lock()
+
+def get_shared_session(base_url: str, api_key: Optional[str] = None,
+                       headers: Optional[Dict[str, str]] = None,
+                       pool_connections: int = 10, pool_maxsize: int = 20,
+                       max_retries: Optional[Retry] = None) -> requests.Session:
+    """Return the process-wide session for a base URL and API key, creating it on first use
+
+    Pool and retry settings only apply when the session is created; the
+    first caller for a given key decides them.
+    """
+    key = (base_url, api_key)
+    with _LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = requests.Session()
+            if headers:
+                session.headers.update(headers)
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries or DEFAULT_RETRY
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSIONS[key] = session
+        return session
+
+def close_shared_sessions():
+    """Close every pooled session, e.g. on application shutdown"""
+    with _LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
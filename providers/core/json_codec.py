@@ -0,0 +1,32 @@
+"""
+JSON codec for provider request and response bodies - orjson when available, stdlib otherwise
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is not installed
+    orjson = None
+
+# Raised by json_loads on malformed input; a ValueError subclass either way
+JSONDecodeError = orjson.JSONDecodeError if orjson is not None else json.JSONDecodeError
+
+def json_dumps(obj) -> bytes:
+    """Serialize a request body to compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def json_dumps_pretty(obj) -> bytes:
+    """Serialize a document for a human-edited file: 2-space indent, UTF-8, non-ASCII kept"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def json_loads(data):
+    """Parse a JSON document given as bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
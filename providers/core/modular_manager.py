@@ -1,9 +1,77 @@
 import os
-import json
 import glob
-from typing import Dict, List, Optional, Any
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Any
 from pathlib import Path
 
+from .json_codec import json_dumps_pretty, json_loads
+from .ttl_cache import versioned_cache
+
+def _umask_file_mode() -> int:
+    """The mode open() gives a new file under the current umask"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# Mode for written extension configs, matching files created with open()
+_CONFIG_FILE_MODE = _umask_file_mode()
+
+@dataclass(slots=True, frozen=True)
+class ModelRecord:
+    """One provider model, normalized once from the provider config"""
+    provider_id: str
+    provider_name: str
+    provider_logo: Optional[str]
+    provider_favicon: Optional[str]
+    requires_api_key: bool
+    api_key_type: str
+    model_id: str
+    model_name: str
+    description: str
+    features: List[str]
+    supported_languages: List[str]
+    languages_set: FrozenSet[str]
+    
+    def to_language_dict(self) -> Dict[str, Any]:
+        """Convert to the get_models_for_language response dict"""
+        return {
+            'provider_id': self.provider_id,
+            'provider_name': self.provider_name,
+            'provider_logo': self.provider_logo,
+            'provider_favicon': self.provider_favicon,
+            'model_id': self.model_id,
+            'model_name': self.model_name,
+            'description': self.description,
+            'requires_api_key': self.requires_api_key,
+            'api_key_type': self.api_key_type
+        }
+    
+    def to_provider_dict(self) -> Dict[str, Any]:
+        """Convert to the get_provider_models response dict"""
+        return {
+            'provider_id': self.provider_id,
+            'provider_name': self.provider_name,
+            'model_id': self.model_id,
+            'model_name': self.model_name,
+            'description': self.description,
+            'supported_languages': self.supported_languages,
+            'requires_api_key': self.requires_api_key
+        }
+    
+    def to_catalog_dict(self) -> Dict[str, Any]:
+        """Convert to the get_all_models response dict"""
+        return {
+            'id': f"{self.provider_id}-{self.model_id}",
+            'name': self.model_name,
+            'provider_id': self.provider_id,
+            'provider_name': self.provider_name,
+            'description': self.description,
+            'features': self.features,
+            'languages': self.supported_languages,
+            'hasApiKey': False  # Will be set by the API endpoint
+        }
+
 class ModularProviderManager:
     """Manages modular ASR providers with config-based extensions"""
     
@@ -12,23 +80,38 @@ class ModularProviderManager:
             extensions_dir = os.path.join(os.path.dirname(__file__), 'extensions')
         self.extensions_dir = Path(extensions_dir)
         self._provider_configs = {}
+        self._config_files = {}  # config path -> (mtime_ns, parsed config)
+        self._cache_version = 0  # bumped whenever _provider_configs changes
         self._load_provider_configs()
     
     def _load_provider_configs(self):
-        """Load all provider configurations from extensions directory"""
-        self._provider_configs = {}
+        """Load all provider configurations from extensions directory
+        
+        Parsed configs are kept with their file mtime, so a reload only
+        re-parses the config files that changed.
+        """
+        provider_configs = {}
+        config_files = {}
+        
+        for config_file in self.extensions_dir.glob('*/config.json'):
+            try:
+                mtime = config_file.stat().st_mtime_ns
+                cached = self._config_files.get(config_file)
+                if cached is not None and cached[0] == mtime:
+                    config = cached[1]
+                else:
+                    config = json_loads(config_file.read_bytes())
+                provider_id = config['provider']['id']
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Error loading config for {config_file.parent.name}: {e}")
+                continue
+            
+            provider_configs[provider_id] = config
+            config_files[config_file] = (mtime, config)
         
-        for provider_dir in self.extensions_dir.glob('*/'):
-            if provider_dir.is_dir():
-                config_file = provider_dir / 'config.json'
-                if config_file.exists():
-                    try:
-                        with open(config_file, 'r', encoding='utf-8') as f:
-                            config = json.load(f)
-                            provider_id = config['provider']['id']
-                            self._provider_configs[provider_id] = config
-                    except Exception as e:
-                        print(f"Error loading config for {provider_dir.name}: {e}")
+        self._provider_configs = provider_configs
+        self._config_files = config_files
+        self._cache_version += 1
     
     def get_available_providers(self) -> Dict[str, Dict]:
         """Get all available providers with their basic info"""
@@ -42,74 +125,74 @@ class ModularProviderManager:
         """Get full configuration for a specific provider"""
         return self._provider_configs.get(provider_id)
     
+    @versioned_cache
     def get_all_languages(self) -> Dict[str, Dict]:
-        """Get all supported languages across all providers"""
-        all_languages = {}
+        """Get all supported languages across all providers
+        
+        Language info comes from the first provider that lists the language;
+        the config dicts themselves are left untouched.
+        """
+        infos_by_lang = {}
+        providers_by_lang = {}
         
         for config in self._provider_configs.values():
-            languages = config.get('languages', {})
-            for lang_code, lang_info in languages.items():
-                if lang_code not in all_languages:
-                    all_languages[lang_code] = lang_info
-                    all_languages[lang_code]['providers'] = []
-                
-                if config['provider']['id'] not in all_languages[lang_code]['providers']:
-                    all_languages[lang_code]['providers'].append(config['provider']['id'])
+            provider_id = config['provider']['id']
+            for lang_code, lang_info in config.get('languages', {}).items():
+                if lang_code not in infos_by_lang:
+                    infos_by_lang[lang_code] = lang_info
+                    providers_by_lang[lang_code] = {}
+                # A dict keeps provider order while deduplicating in O(1)
+                providers_by_lang[lang_code][provider_id] = None
         
-        return all_languages
+        return {
+            lang_code: {**lang_info, 'providers': list(providers_by_lang[lang_code])}
+            for lang_code, lang_info in infos_by_lang.items()
+        }
     
     def get_models_for_language(self, language_code: str, available_providers: List[str] = None) -> List[Dict]:
         """Get all models that support a specific language"""
-        models = []
-        
-        for provider_id, config in self._provider_configs.items():
+        allowed = set(available_providers) if available_providers else None
+        return [
+            record.to_language_dict()
+            for provider_id, records in self._model_table().items()
             # Filter by available providers if specified
-            if available_providers and provider_id not in available_providers:
-                continue
-            
-            provider_info = config['provider']
-            provider_models = config.get('models', [])
-            
-            for model in provider_models:
-                if language_code in model.get('supported_languages', []):
-                    model_info = {
-                        'provider_id': provider_id,
-                        'provider_name': provider_info['name'],
-                        'provider_logo': provider_info.get('logo'),
-                        'provider_favicon': provider_info.get('favicon'),
-                        'model_id': model['id'],
-                        'model_name': model['name'],
-                        'description': model.get('description', ''),
-                        'requires_api_key': provider_info.get('requires_api_key', True),
-                        'api_key_type': provider_info.get('api_key_type', 'string')
-                    }
-                    models.append(model_info)
-        
-        return models
+            if allowed is None or provider_id in allowed
+            for record in records
+            if language_code in record.languages_set
+        ]
     
     def get_provider_models(self, provider_id: str) -> List[Dict]:
         """Get all models for a specific provider"""
-        config = self._provider_configs.get(provider_id)
-        if not config:
-            return []
-        
-        provider_info = config['provider']
-        models = []
+        return [record.to_provider_dict() for record in self._model_table().get(provider_id, ())]
+    
+    @versioned_cache
+    def _model_table(self) -> Dict[str, List[ModelRecord]]:
+        """Normalize every provider's models once into records keyed by provider ID"""
+        table = {}
         
-        for model in config.get('models', []):
-            model_info = {
-                'provider_id': provider_id,
-                'provider_name': provider_info['name'],
-                'model_id': model['id'],
-                'model_name': model['name'],
-                'description': model.get('description', ''),
-                'supported_languages': model.get('supported_languages', []),
-                'requires_api_key': provider_info.get('requires_api_key', True)
-            }
-            models.append(model_info)
+        for provider_id, config in self._provider_configs.items():
+            provider_info = config['provider']
+            table[provider_id] = [
+                ModelRecord(
+                    provider_id=provider_id,
+                    provider_name=provider_info['name'],
+                    provider_logo=provider_info.get('logo'),
+                    provider_favicon=provider_info.get('favicon'),
+                    requires_api_key=provider_info.get('requires_api_key', True),
+                    api_key_type=provider_info.get('api_key_type', 'string'),
+                    model_id=model['id'],
+                    model_name=model['name'],
+                    description=model.get('description', ''),
+                    features=model.get('features', []),
+                    supported_languages=model.get('supported_languages', []),
+                    languages_set=frozenset(model.get('supported_languages', ()))
+                )
+                for model in config.get('models', [])
+            ]
         
-        return models
+        return table
     
+    @versioned_cache
     def get_languages_by_region(self) -> Dict[str, List[Dict]]:
         """Group languages by region"""
         all_languages = self.get_all_languages()
@@ -170,6 +253,7 @@ class ModularProviderManager:
         
         return errors
     
+    @versioned_cache
     def get_provider_stats(self) -> Dict[str, Any]:
         """Get statistics about loaded providers"""
         stats = {
@@ -199,20 +283,38 @@ class ModularProviderManager:
         self._load_provider_configs()
     
     def add_provider_extension(self, provider_id: str, config: Dict) -> bool:
-        """Add a new provider extension programmatically"""
+        """Add a new provider extension programmatically
+        
+        The config is written to a temporary file and renamed over config.json,
+        so a crash mid-write never leaves a truncated config behind.
+        """
+        tmp_path = None
         try:
             provider_dir = self.extensions_dir / provider_id
             provider_dir.mkdir(exist_ok=True)
             
-            config_file = provider_dir / 'config.json'
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            data = json_dumps_pretty(config)
+            # A unique temp file per writer, so concurrent writers never share one;
+            # mkstemp creates it 0600, so widen it to what a plain open() would give
+            fd, tmp_path = tempfile.mkstemp(dir=provider_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                os.fchmod(f.fileno(), _CONFIG_FILE_MODE)
+                f.write(data)
+            os.replace(tmp_path, provider_dir / 'config.json')
+            tmp_path = None
             
             self._provider_configs[provider_id] = config
+            self._cache_version += 1
             return True
-        except Exception as e:
+        except (OSError, TypeError, ValueError) as e:
             print(f"Error adding provider extension {provider_id}: {e}")
             return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
     
     def get_all_providers(self) -> List[Dict]:
         """Get all providers as a list with their configurations"""
@@ -229,31 +331,16 @@ class ModularProviderManager:
     
     def get_all_models(self, available_providers: List[str] = None) -> List[Dict]:
         """Get all models from all providers"""
-        models = []
-        
-        for provider_id, config in self._provider_configs.items():
+        allowed = set(available_providers) if available_providers else None
+        return [
+            record.to_catalog_dict()
+            for provider_id, records in self._model_table().items()
             # Filter by available providers if specified
-            if available_providers and provider_id not in available_providers:
-                continue
-            
-            provider_info = config['provider']
-            provider_models = config.get('models', [])
-            
-            for model in provider_models:
-                model_info = {
-                    'id': f"{provider_id}-{model['id']}",
-                    'name': model['name'],
-                    'provider_id': provider_id,
-                    'provider_name': provider_info['name'],
-                    'description': model.get('description', ''),
-                    'features': model.get('features', []),
-                    'languages': model.get('supported_languages', []),
-                    'hasApiKey': False  # Will be set by the API endpoint
-                }
-                models.append(model_info)
-        
-        return models
+            if allowed is None or provider_id in allowed
+            for record in records
+        ]
     
+    @versioned_cache
     def get_all_languages_formatted(self) -> List[Dict]:
         """Get all languages formatted for frontend consumption"""
         all_languages = self.get_all_languages()
@@ -1,14 +1,36 @@
 import os
-import json
 import sys
 import importlib.util
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+from .config_cache import load_json_cached
+from .ttl_cache import versioned_cache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on provider modules imported concurrently during warm-up
+WARM_UP_WORKERS = 8
+
+# Provider instances kept per manager; the least recently used is dropped as API keys rotate
+INSTANCE_CACHE_SIZE = 128
+
+# Parsed language packs shared by every manager: path -> (st_mtime_ns, languages)
+_LANGUAGE_PACKS: Dict[str, Tuple[int, Dict]] = {}
+
+def _is_provider_dir(entry: os.DirEntry) -> bool:
+    """Whether a scanned entry may hold a provider; hidden and cache directories are skipped by name"""
+    name = entry.name
+    return not name.startswith('.') and name != '__pycache__' and entry.is_dir()
 
 class ProviderManager:
     """Manages ASR providers by scanning the providers folder"""
     
-    def __init__(self, providers_dir: str = None):
+    def __init__(self, providers_dir: str = None, warm_up: bool = False):
         if providers_dir is None:
             # Default to providers folder (parent of core)
             providers_dir = Path(__file__).parent.parent
@@ -16,33 +38,51 @@ class ProviderManager:
         self.providers_dir = Path(providers_dir)
         self.providers = {}
         self._provider_classes_cache = {}  # Cache for loaded provider classes
-        self._provider_instances_cache = {}  # Cache for provider instances
+        self._classes_lock = threading.Lock()  # Guards _provider_classes_cache during parallel warm-up
+        self._provider_instances_cache = OrderedDict()  # (provider_id, api_key) -> provider instance, LRU order
+        self._instances_lock = threading.Lock()  # Guards _provider_instances_cache
         self._api_keys_cache = {}  # Cache for API keys to avoid database calls
+        self._cache_version = 0  # Bumped whenever self.providers changes
         
         # Load centralized language pack
         self._load_language_pack()
         self._load_providers()
         
-        # Warm up all providers at startup for optimal performance
-        self._warm_up_providers()
+        # Provider classes are imported on first use; warm_up preloads them all in
+        # the background instead, so construction still returns immediately
+        if warm_up:
+            threading.Thread(target=self._warm_up_providers, name='provider-warm-up', daemon=True).start()
     
     def _load_language_pack(self):
-        """Load centralized language pack"""
+        """Load centralized language pack
+        
+        The parsed pack is shared by all managers until the file changes; it is
+        treated as read-only.
+        """
         try:
             # Load language pack from src/config folder
             language_pack_file = Path(__file__).parent.parent.parent / 'src' / 'config' / 'language_pack.json'
             
-            if language_pack_file.exists():
-                with open(language_pack_file, 'r', encoding='utf-8') as f:
-                    language_pack = json.load(f)
-                    self.language_pack = language_pack.get('languages', {})
-                    print(f"✅ Loaded language pack with {len(self.language_pack)} languages")
-            else:
-                print(f"Language pack not found: {language_pack_file}")
+            try:
+                mtime_ns = language_pack_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                logger.warning("Language pack not found: %s", language_pack_file)
                 self.language_pack = {}
-                
+                return
+            
+            cache_key = str(language_pack_file)
+            cached = _LANGUAGE_PACKS.get(cache_key)
+            if cached is not None and cached[0] == mtime_ns:
+                self.language_pack = cached[1]
+                return
+            
+            language_pack = load_json_cached(language_pack_file)
+            self.language_pack = language_pack.get('languages', {})
+            _LANGUAGE_PACKS[cache_key] = (mtime_ns, self.language_pack)
+            logger.info("Loaded language pack with %d languages", len(self.language_pack))
+        
         except Exception as e:
-            print(f"Error loading language pack: {e}")
+            logger.error("Error loading language pack: %s", e)
             self.language_pack = {}
     
     def _load_providers(self):
@@ -50,97 +90,109 @@ class ProviderManager:
         self.providers = {}
         
         if not self.providers_dir.exists():
-            print(f"Providers directory not found: {self.providers_dir}")
+            logger.warning("Providers directory not found: %s", self.providers_dir)
             return
         
         # Scan for both old flat structure and new nested structure
         ai_types = ['ASR', 'TTS', 'AI', 'Embedding']
         
         # First, try to load from nested structure (providers/ASR/, providers/TTS/, etc.)
+        # os.scandir answers is_dir() from the directory entry, without a stat per child
         for ai_type in ai_types:
             ai_type_dir = self.providers_dir / ai_type
-            if ai_type_dir.exists() and ai_type_dir.is_dir():
-                print(f"Loading {ai_type} providers from {ai_type_dir}")
-                for provider_path in ai_type_dir.iterdir():
-                    if provider_path.is_dir():
-                        self._load_provider(provider_path, ai_type)
+            if ai_type_dir.is_dir():
+                logger.info("Loading %s providers from %s", ai_type, ai_type_dir)
+                with os.scandir(ai_type_dir) as entries:
+                    for entry in entries:
+                        if _is_provider_dir(entry):
+                            self._load_provider(Path(entry.path), ai_type)
         
         # Fallback: scan root providers directory for backwards compatibility
-        for provider_path in self.providers_dir.iterdir():
-            if provider_path.is_dir() and provider_path.name not in ai_types:
-                self._load_provider(provider_path, 'ASR')  # Default to ASR for legacy providers
+        with os.scandir(self.providers_dir) as entries:
+            for entry in entries:
+                if entry.name not in ai_types and _is_provider_dir(entry):
+                    self._load_provider(Path(entry.path), 'ASR')  # Default to ASR for legacy providers
+        
+        self._cache_version += 1
     
     def _load_provider(self, provider_path: Path, ai_type: str = 'ASR'):
         """Load a single provider from its directory"""
         provider_name = provider_path.name
         config_file = provider_path / 'config.json'
         
-        if not config_file.exists():
-            print(f"No config.json found for provider: {provider_name}")
-            return
-        
         try:
-            # Load config
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            # Load config; a missing file is found by the load itself rather than a separate exists() check
+            try:
+                config = load_json_cached(config_file)
+            except FileNotFoundError:
+                logger.debug("No config.json found for provider: %s", provider_name)
+                return
             
             provider_id = config['provider']['id']
             
-            # Find the Python implementation file
-            python_files = list(provider_path.glob('*.py'))
-            if not python_files:
-                print(f"No Python implementation found for provider: {provider_name}")
-                return
-            
-            # Use the first Python file (or find one that matches pattern)
+            # Find the Python implementation file in one directory pass: the first
+            # file named for the provider type (e.g., _tts.py), or the ASR pattern
+            # for backwards compatibility, otherwise the first Python file
+            impl_suffixes = (f'_{ai_type.lower()}.py', '_asr.py')
             impl_file = None
-            ai_type_lower = ai_type.lower()
-            for py_file in python_files:
-                # Try to match provider type first (e.g., _tts.py, _asr.py)
-                if py_file.name.endswith(f'_{ai_type_lower}.py') or py_file.name == f"{provider_id}_{ai_type_lower}.py":
-                    impl_file = py_file
-                    break
-                # Fallback to ASR pattern for backwards compatibility
-                elif py_file.name.endswith('_asr.py') or py_file.name == f"{provider_id}_asr.py":
-                    impl_file = py_file
-                    break
+            fallback_file = None
+            with os.scandir(provider_path) as entries:
+                for entry in entries:
+                    file_name = entry.name
+                    if not file_name.endswith('.py') or file_name.startswith('.'):
+                        continue
+                    if file_name.endswith(impl_suffixes):
+                        impl_file = Path(entry.path)
+                        break
+                    if fallback_file is None:
+                        fallback_file = Path(entry.path)
             
-            if not impl_file:
-                impl_file = python_files[0]  # Use first Python file as fallback
+            if impl_file is None:
+                impl_file = fallback_file  # Use first Python file as fallback
+            if impl_file is None:
+                logger.warning("No Python implementation found for provider: %s", provider_name)
+                return
             
             # Add provider_type to config if not present
             if 'provider_type' not in config['provider']:
                 config['provider']['provider_type'] = ai_type
             
-            # Store provider info
+            # Store provider info, with the fields read on hot paths flattened out of config
+            provider_cfg = config['provider']
+            models = config.get('models', [])
             self.providers[provider_id] = {
                 'config': config,
+                'provider_cfg': provider_cfg,
+                'models': models,
+                # Deduplicated language codes per model, aligned with models; the
+                # original lists stay in the config for clients
+                'language_sets': tuple(frozenset(model.get('supported_languages', ())) for model in models),
+                'requires_api_key': provider_cfg.get('requires_api_key', True),
+                'entry_class': provider_cfg.get('entry_class'),
                 'path': provider_path,
                 'impl_file': impl_file,
                 'name': provider_name,
                 'ai_type': ai_type
             }
             
-            print(f"Loaded {ai_type} provider: {provider_name} ({provider_id})")
-            
+            logger.info("Loaded %s provider: %s (%s)", ai_type, provider_name, provider_id)
+        
         except Exception as e:
-            print(f"Error loading provider {provider_name}: {e}")
+            logger.error("Error loading provider %s: %s", provider_name, e)
     
+    @versioned_cache
     def get_all_languages(self) -> List[Dict]:
-        """Get all languages from centralized language pack, filtered by provider support"""
-        supported_languages = {}
+        """Get all languages from centralized language pack, filtered by provider support
+        
+        The list is computed once per set of loaded providers and shared by callers.
+        """
+        supported_languages = {}  # lang code -> {provider_id: None}, an insertion-ordered set
         
         # Collect all language codes supported by providers
         for provider_id, provider_info in self.providers.items():
-            config = provider_info['config']
-            provider_models = config.get('models', [])
-            
-            for model in provider_models:
-                for lang_code in model.get('supported_languages', []):
-                    if lang_code not in supported_languages:
-                        supported_languages[lang_code] = []
-                    if provider_id not in supported_languages[lang_code]:
-                        supported_languages[lang_code].append(provider_id)
+            for language_set in provider_info['language_sets']:
+                for lang_code in language_set:
+                    supported_languages.setdefault(lang_code, {})[provider_id] = None
         
         # Build language list using centralized language pack
         languages_list = []
@@ -152,7 +204,7 @@ class ProviderManager:
                     'name': lang_info['name'],
                     'flag': lang_info.get('flag', '🌐'),
                     'region': lang_info.get('region', 'Other'),
-                    'providers': supported_languages[lang_code]
+                    'providers': list(supported_languages[lang_code])
                 })
             else:
                 # Fallback for languages not in language pack
@@ -161,41 +213,46 @@ class ProviderManager:
                     'name': lang_code.upper(),
                     'flag': '🌐',
                     'region': 'Other',
-                    'providers': supported_languages[lang_code]
+                    'providers': list(supported_languages[lang_code])
                 })
         
-        # Sort by region (India first) then by name
-        languages_list.sort(key=lambda x: (x['region'] != 'India', x['region'], x['name']))
+        # Sort by region (India first) then by name; the code breaks ties between equal names
+        languages_list.sort(key=lambda x: (x['region'] != 'India', x['region'], x['name'], x['code']))
         return languages_list
     
     def get_models_for_language(self, language_code: str) -> List[Dict]:
         """Get all models that support a specific language with provider info"""
-        models = []
+        # Callers annotate the returned dicts, so hand out copies of the indexed entries
+        return [dict(model_info) for model_info in self._language_index().get(language_code, ())]
+    
+    @versioned_cache
+    def _language_index(self) -> Dict[str, List[Dict]]:
+        """Map each language code to the model info of every model supporting it"""
+        index = {}
         
         for provider_id, provider_info in self.providers.items():
-            config = provider_info['config']
-            provider_config = config['provider']
-            provider_models = config.get('models', [])
+            provider_config = provider_info['provider_cfg']
+            requires_api_key = provider_info['requires_api_key']
             
-            for model in provider_models:
-                if language_code in model.get('supported_languages', []):
-                    model_info = {
-                        'id': f"{provider_id}-{model['id']}",
-                        'provider_id': provider_id,
-                        'provider_name': provider_config['name'],
-                        'provider_folder': provider_info['name'],
-                        'provider_icon_url': provider_config.get('icon_url', ''),
-                        'provider_logo_url': provider_config.get('logo_url', ''),
-                        'model_id': model['id'],
-                        'name': model['name'],
-                        'description': model.get('description', ''),
-                        'features': model.get('features', []),
-                        'supported_languages': model.get('supported_languages', []),
-                        'requires_api_key': provider_config.get('requires_api_key', True)
-                    }
-                    models.append(model_info)
-        
-        return models
+            for model, language_set in zip(provider_info['models'], provider_info['language_sets']):
+                model_info = {
+                    'id': f"{provider_id}-{model['id']}",
+                    'provider_id': provider_id,
+                    'provider_name': provider_config['name'],
+                    'provider_folder': provider_info['name'],
+                    'provider_icon_url': provider_config.get('icon_url', ''),
+                    'provider_logo_url': provider_config.get('logo_url', ''),
+                    'model_id': model['id'],
+                    'name': model['name'],
+                    'description': model.get('description', ''),
+                    'features': model.get('features', []),
+                    'supported_languages': model.get('supported_languages', []),
+                    'requires_api_key': requires_api_key
+                }
+                for lang_code in language_set:
+                    index.setdefault(lang_code, []).append(model_info)
+        
+        return index
     
     def get_provider_instance(self, provider_id: str, api_key: str = None):
         """Get a cached instance of a provider class"""
@@ -203,11 +260,14 @@ class ProviderManager:
             raise ValueError(f"Provider {provider_id} not found")
         
         # Create cache key that includes API key for providers that need it
-        cache_key = f"{provider_id}_{api_key}" if api_key else provider_id
+        cache_key = (provider_id, api_key or None)
         
         # Return cached instance if available
-        if cache_key in self._provider_instances_cache:
-            return self._provider_instances_cache[cache_key]
+        with self._instances_lock:
+            instance = self._provider_instances_cache.get(cache_key)
+            if instance is not None:
+                self._provider_instances_cache.move_to_end(cache_key)
+                return instance
         
         # Load provider class if not cached
         if provider_id not in self._provider_classes_cache:
@@ -219,15 +279,18 @@ class ProviderManager:
         
         try:
             # Initialize the provider instance
-            if config['provider'].get('requires_api_key', True):
+            if provider_info['requires_api_key']:
                 instance = provider_class(config, api_key)
             else:
                 instance = provider_class(config)
             
             # Cache the instance
-            self._provider_instances_cache[cache_key] = instance
+            with self._instances_lock:
+                self._provider_instances_cache[cache_key] = instance
+                while len(self._provider_instances_cache) > INSTANCE_CACHE_SIZE:
+                    self._provider_instances_cache.popitem(last=False)
             return instance
-            
+        
         except Exception as e:
             raise Exception(f"Failed to instantiate provider {provider_id}: {e}")
     
@@ -242,52 +305,64 @@ class ProviderManager:
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
             
-            # Find the provider class (convention: ProviderNameASR, ProviderNameTTS, etc.)
-            provider_type = provider_info['ai_type']
-            class_suffixes = [provider_type, 'ASR']  # Try provider type first, then default to ASR
-            
-            class_name = None
-            for suffix in class_suffixes:
-                for attr_name in dir(module):
-                    if attr_name.endswith(suffix) and not attr_name.startswith('_'):
-                        class_name = attr_name
-                        break
-                if class_name:
-                    break
-            
-            if not class_name:
-                raise ValueError(f"No {provider_type} class found in {impl_file}")
-            
-            provider_class = getattr(module, class_name)
-            
-            # Cache the class
-            self._provider_classes_cache[provider_id] = provider_class
+            # Prefer the class named in config.json; legacy configs fall back to the
+            # naming convention (ProviderNameASR, ProviderNameTTS, etc.)
+            entry_class = provider_info.get('entry_class')
+            if entry_class:
+                provider_class = getattr(module, entry_class, None)
+                if provider_class is None:
+                    raise ValueError(f"Class {entry_class} not found in {impl_file}")
+            else:
+                provider_class = self._find_provider_class(module, provider_info['ai_type'], impl_file)
             
+            # Cache the class; a concurrent load of the same provider keeps the first one
+            with self._classes_lock:
+                self._provider_classes_cache.setdefault(provider_id, provider_class)
+        
         except Exception as e:
             raise Exception(f"Failed to load provider class {provider_id}: {e}")
     
+    def _find_provider_class(self, module, provider_type: str, impl_file: Path):
+        """Find a provider class by naming convention for configs without entry_class"""
+        class_suffixes = [provider_type, 'ASR']  # Try provider type first, then default to ASR
+        
+        for suffix in class_suffixes:
+            for attr_name in dir(module):
+                if attr_name.endswith(suffix) and not attr_name.startswith('_'):
+                    return getattr(module, attr_name)
+        
+        raise ValueError(f"No {provider_type} class found in {impl_file}")
+    
     def _warm_up_providers(self):
-        """Pre-load and warm up all provider classes for optimal performance"""
-        print("🔥 Warming up providers...")
+        """Pre-load and warm up all provider classes for optimal performance
         
-        for provider_id in self.providers.keys():
-            try:
-                # Pre-load the provider class
-                self._load_provider_class(provider_id)
-                
-                # For providers that don't require API keys, create a warmed instance
-                config = self.providers[provider_id]['config']
-                if not config['provider'].get('requires_api_key', True):
-                    # Create a warm instance without API key
-                    self.get_provider_instance(provider_id)
-                    print(f"✅ Warmed up {provider_id} (no API key required)")
-                else:
-                    print(f"⚡ Pre-loaded {provider_id} class (API key required for instance)")
-                    
-            except Exception as e:
-                print(f"⚠️  Failed to warm up {provider_id}: {e}")
-        
-        print(f"🚀 Provider warm-up complete! {len(self._provider_classes_cache)} classes loaded")
+        Provider modules are imported in parallel; each import is independent
+        and mostly file I/O and bytecode compilation.
+        """
+        logger.info("Warming up providers...")
+        
+        if self.providers:
+            with ThreadPoolExecutor(max_workers=min(WARM_UP_WORKERS, len(self.providers))) as executor:
+                list(executor.map(self._safe_warm, list(self.providers)))
+        
+        logger.info("Provider warm-up complete! %d classes loaded", len(self._provider_classes_cache))
+    
+    def _safe_warm(self, provider_id: str):
+        """Warm up a single provider, logging failures instead of raising"""
+        try:
+            # Pre-load the provider class
+            self._load_provider_class(provider_id)
+            
+            # For providers that don't require API keys, create a warmed instance
+            if not self.providers[provider_id]['requires_api_key']:
+                # Create a warm instance without API key
+                self.get_provider_instance(provider_id)
+                logger.info("Warmed up %s (no API key required)", provider_id)
+            else:
+                logger.info("Pre-loaded %s class (API key required for instance)", provider_id)
+        
+        except Exception as e:
+            logger.warning("Failed to warm up %s: %s", provider_id, e)
     
     def cache_api_key(self, provider_id: str, api_key: str):
         """Cache an API key to avoid database calls"""
@@ -310,13 +385,15 @@ class ProviderManager:
         if provider_id:
             self._api_keys_cache.pop(provider_id, None)
             # Also clear related provider instances since API key changed
-            keys_to_remove = [k for k in self._provider_instances_cache.keys() if k.startswith(f"{provider_id}_")]
-            for key in keys_to_remove:
-                self._provider_instances_cache.pop(key, None)
+            with self._instances_lock:
+                keys_to_remove = [k for k in self._provider_instances_cache if k[0] == provider_id and k[1]]
+                for key in keys_to_remove:
+                    self._provider_instances_cache.pop(key, None)
         else:
             self._api_keys_cache.clear()
             # Clear all instances since API keys changed
-            self._provider_instances_cache.clear()
+            with self._instances_lock:
+                self._provider_instances_cache.clear()
     
     def get_provider_config(self, provider_id: str) -> Optional[Dict]:
         """Get the configuration for a specific provider"""
@@ -327,7 +404,7 @@ class ProviderManager:
         """Get all provider configurations"""
         providers_list = []
         for provider_id, provider_info in self.providers.items():
-            config = provider_info['config']['provider'].copy()
+            config = provider_info['provider_cfg'].copy()
             config['id'] = provider_id
             config['folder_name'] = provider_info['name']
             config['provider_type'] = provider_info.get('ai_type', 'ASR')  # Include AI type
@@ -349,6 +426,7 @@ class ProviderManager:
                 'message': f"Failed to test provider {provider_id}: {str(e)}"
             }
     
+    @versioned_cache
     def get_provider_stats(self) -> Dict[str, Any]:
         """Get statistics about loaded providers"""
         total_models = 0
@@ -356,9 +434,8 @@ class ProviderManager:
         api_required_count = 0
         
         for provider_info in self.providers.values():
-            config = provider_info['config']
-            total_models += len(config.get('models', []))
-            if config['provider'].get('requires_api_key', True):
+            total_models += len(provider_info['models'])
+            if provider_info['requires_api_key']:
                 api_required_count += 1
         
         return {
@@ -379,8 +456,9 @@ class ProviderManager:
             provider_path = Path(provider_folder_path)
             if provider_path.exists() and provider_path.is_dir():
                 self._load_provider(provider_path)
+                self._cache_version += 1
                 return True
             return False
         except Exception as e:
-            print(f"Error adding provider folder {provider_folder_path}: {e}")
+            logger.error("Error adding provider folder %s: %s", provider_folder_path, e)
             return False
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Provider result types - slotted records returned by provider hot paths
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+@dataclass(slots=True)
+class TTSResult:
+    """Outcome of a single text-to-speech synthesis"""
+    success: bool
+    error: Optional[str] = None
+    audio_data: Optional[bytes] = None
+    audio_url: Optional[str] = None
+    audio_size_bytes: int = 0
+    audio_duration: float = 0.0
+    processing_time: float = 0.0
+    model_used: Optional[str] = None
+    voice_used: Optional[str] = None
+    format: Optional[str] = None
+    text_length: int = 0
+    character_count: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the standard TTS response dict"""
+        if not self.success:
+            return {
+                'success': False,
+                'error': self.error,
+                'audio_data': self.audio_data,
+                'audio_size_bytes': self.audio_size_bytes,
+                'processing_time': self.processing_time
+            }
+        
+        return {
+            'success': True,
+            'audio_data': self.audio_data,
+            'audio_url': self.audio_url,
+            'audio_size_bytes': self.audio_size_bytes,
+            'audio_duration': self.audio_duration,
+            'processing_time': self.processing_time,
+            'model_used': self.model_used,
+            'voice_used': self.voice_used,
+            'format': self.format,
+            'text_length': self.text_length,
+            'character_count': self.character_count,
+            'error': self.error
+        }
+
+@dataclass(slots=True)
+class TranscriptionResult:
+    """Outcome of a single speech-to-text transcription"""
+    success: bool
+    error: Optional[str] = None
+    transcription: str = ''
+    confidence: float = 0.0
+    processing_time: float = 0.0
+    audio_duration: float = 0.0
+    model_used: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)  # provider-specific extra fields
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the standard ASR response dict"""
+        if not self.success:
+            return {
+                'success': False,
+                'error': self.error,
+                'transcription': self.transcription,
+                'confidence': self.confidence
+            }
+        
+        result = {
+            'success': True,
+            'transcription': self.transcription,
+            'confidence': self.confidence,
+            'processing_time': self.processing_time,
+            'audio_duration': self.audio_duration,
+            'model_used': self.model_used
+        }
+        result.update(self.details)
+        result['error'] = self.error
+        return result
@@ -0,0 +1,45 @@
+"""
+Per-instance memoization for provider catalog lookups - by TTL or by data version
+"""
+
+import functools
+import time
+
+def ttl_cache(ttl: float):
+    """Memoize a method per instance for ttl seconds; exceptions are not cached
+    
+    Entries live in the instance's _ttl_cache dict, keyed by method name and
+    positional arguments, so each provider instance (one per API key) keeps
+    its own catalog.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            cache = self.__dict__.setdefault('_ttl_cache', {})
+            key = (method.__name__, args)
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and now - entry[1] < ttl:
+                return entry[0]
+            value = method(self, *args)
+            cache[key] = (value, now)
+            return value
+        return wrapper
+    return decorator
+
+def versioned_cache(method):
+    """Memoize a no-argument method until the instance's _cache_version changes
+    
+    For aggregates derived from loaded configs: the owner bumps _cache_version
+    whenever those configs change, which invalidates every memoized result.
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self.__dict__.setdefault('_versioned_cache', {})
+        entry = cache.get(method.__name__)
+        if entry is not None and entry[0] == self._cache_version:
+            return entry[1]
+        value = method(self)
+        cache[method.__name__] = (self._cache_version, value)
+        return value
+    return wrapper
@@ -11,7 +11,7 @@ from typing import List, Dict, Optional
 from datetime import datetime
 from asyncio import create_task
 from fastapi import FastAPI, Request, Form, File, UploadFile, HTTPException, Depends
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from dotenv import load_dotenv
@@ -1557,6 +1557,66 @@ async def generate_tts_audio(request: Request):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate TTS audio: {str(e)}")
 
+# Content types for streamed TTS audio, keyed by requested audio format
+AUDIO_MEDIA_TYPES = {
+    'mp3': 'audio/mpeg',
+    'wav': 'audio/wav',
+    'ogg': 'audio/ogg'
+}
+
+@app.post("/api/tts/stream")
+async def stream_tts_audio(request: Request):
+    """Stream TTS audio for a single voice as the provider produces it"""
+    data = await request.json()
+    text = data.get('text', '').strip()
+    language = data.get('language', 'en-US')
+    provider_id = data.get('provider', '')
+    voice_id = data.get('voice', '')
+    audio_format = data.get('audio_format', 'mp3')
+    speed = data.get('speed', 1.0)
+    
+    if not all([text, provider_id, voice_id]):
+        raise HTTPException(status_code=400, detail="Missing required parameters")
+    
+    # Get API key for provider
+    api_key = provider_manager.get_cached_api_key(provider_id)
+    if not api_key:
+        api_key = db.get_api_key(provider_id)
+        if api_key:
+            provider_manager.cache_api_key(provider_id, api_key)
+    
+    provider_config = provider_manager.get_provider_config(provider_id)
+    if not provider_config:
+        raise HTTPException(status_code=404, detail="Provider not found")
+    
+    if provider_config['provider']['requires_api_key'] and not api_key:
+        raise HTTPException(status_code=400, detail="API key required for this provider")
+    
+    provider_instance = provider_manager.get_provider_instance(provider_id, api_key)
+    if not hasattr(provider_instance, 'stream_speech'):
+        raise HTTPException(status_code=400, detail="Streaming is not supported by this provider")
+    
+    # Pull the first chunk before responding so provider errors still map to an HTTP status
+    chunks = provider_instance.stream_speech(text, voice_id, language, audio_format, speed)
+    try:
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b''
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Failed to stream TTS audio: {str(e)}")
+    
+    async def audio_body():
+        try:
+            yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+    
+    return StreamingResponse(audio_body(), media_type=AUDIO_MEDIA_TYPES.get(audio_format, 'application/octet-stream'))
+
 # Catch-all route for React Router (SPA) - MUST be last!
 @app.get("/{path:path}", response_class=HTMLResponse)
 async def catch_all(path: str):
@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 # Import our optimized providers
 from providers import provider_factory
+from providers.core.http_session_pool import close_shared_sessions
 from utils.database import DatabaseManager
 from utils.auth import admin_auth, get_current_admin
 
@@ -36,6 +37,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("🔄 Shutting down server...")
+    close_shared_sessions()
 
 async def warm_up_caches():
     """Pre-warm caches for better performance"""